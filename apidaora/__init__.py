@@ -5,11 +5,14 @@ ASGI App using dataclasses module for request/response objects
 __version__ = '0.28.0'
 
 from apidaora.app import appdaora
-from apidaora.bodies import GZipFactory
+from apidaora.bodies import BodyStream, GZipFactory
+from apidaora.cache import LRUCache
 from apidaora.class_controller import ClassController
+from apidaora.compression import Compression
 from apidaora.content import ContentType
 from apidaora.exceptions import BadRequestError
 from apidaora.header import Header
+from apidaora.instrumentation import Instrumentation
 from apidaora.method import MethodType
 from apidaora.middlewares import (
     BackgroundTaskMiddleware,
@@ -23,8 +26,11 @@ from apidaora.responses import (
     html,
     javascript,
     json,
+    json_stream,
+    ndjson,
     no_content,
     not_found,
+    stream,
     text,
 )
 from apidaora.route.decorator import RoutedControllerTypeHint, route
@@ -52,4 +58,11 @@ __all__ = [
     'RoutedControllerTypeHint',
     'css',
     'javascript',
+    'LRUCache',
+    'BodyStream',
+    'stream',
+    'json_stream',
+    'ndjson',
+    'Compression',
+    'Instrumentation',
 ]
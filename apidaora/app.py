@@ -1,14 +1,27 @@
 from collections import defaultdict
 from logging import Logger, getLogger
-from typing import Any, DefaultDict, List, Optional, Sequence, Type, Union
-
-from .asgi.app import asgi_app
+from typing import (
+    Any,
+    DefaultDict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .asgi.app import LifespanHook, Preflight, asgi_app
 from .asgi.base import ASGIApp
-from .asgi.router import Controller, Route, make_router
+from .asgi.router import Controller, ResolvedRoute, Route, make_router
+from .bodies import MAX_DECOMPRESSED_BODY_SIZE
+from .cache import LRUCache
 from .class_controller import ClassController
+from .compression import Compression
 from .controllers.background_task import BackgroundTask
+from .instrumentation import Instrumentation
 from .method import MethodType
-from .middlewares import Middlewares
+from .middlewares import CorsMiddleware, Middlewares
 from .options import make_options_controller
 from .route.factory import make_route
 
@@ -32,8 +45,19 @@ def appdaora(
     middlewares: Optional[Middlewares] = None,
     options: bool = False,
     logger: Logger = getLogger(__name__),
+    routes_cache: Optional[LRUCache[Tuple[str, str], ResolvedRoute]] = None,
+    not_found_cache: Optional[LRUCache[str, bool]] = None,
+    max_body_size: Optional[int] = None,
+    max_decompressed_body_size: Optional[int] = MAX_DECOMPRESSED_BODY_SIZE,
+    compression: Optional[Compression] = None,
+    pool_size: int = 0,
+    instrumentation: Optional[Instrumentation] = None,
+    startup: Sequence[LifespanHook] = (),
+    shutdown: Sequence[LifespanHook] = (),
 ) -> ASGIApp:
     routes = []
+    startup_hooks = list(startup)
+    shutdown_hooks = list(shutdown)
     func_controllers: List[Union[Controller, BackgroundTask]] = []
     path_methods_map: DefaultDict[str, List[MethodType]] = defaultdict(list)
 
@@ -64,6 +88,14 @@ def appdaora(
 
     for controller in func_controllers:
         if isinstance(controller, BackgroundTask):
+            if controller.startup and controller.startup not in startup_hooks:
+                startup_hooks.append(controller.startup)
+
+            if controller.shutdown and (
+                controller.shutdown not in shutdown_hooks
+            ):
+                shutdown_hooks.append(controller.shutdown)
+
             routes.extend(controller.create.routes)
             routes.extend(controller.get_results.routes)
             if options:
@@ -93,10 +125,50 @@ def appdaora(
                 )
             )
 
-    return asgi_app(
-        make_router(routes, middlewares=middlewares, logger=logger)
+    if instrumentation:
+        if instrumentation.metrics_path:
+            routes.append(
+                make_route(
+                    instrumentation.metrics_path,
+                    MethodType.GET,
+                    instrumentation.metrics_controller,
+                )
+            )
+
+        for route in routes:
+            route.controller.instrumentation = instrumentation
+
+    app = asgi_app(
+        make_router(
+            routes,
+            middlewares=middlewares,
+            logger=logger,
+            cache=routes_cache,
+            not_found_cache=not_found_cache,
+        ),
+        max_body_size=max_body_size,
+        max_decompressed_body_size=max_decompressed_body_size,
+        preflight=get_preflight(middlewares),
+        pool_size=pool_size,
+        instrumentation=instrumentation,
+        startup=startup_hooks,
+        shutdown=shutdown_hooks,
     )
 
+    if compression:
+        return compression(app)
+
+    return app
+
+
+def get_preflight(middlewares: Optional[Middlewares]) -> Optional[Preflight]:
+    if middlewares:
+        for middleware in middlewares.post_execution:
+            if isinstance(middleware, CorsMiddleware):
+                return middleware.get_preflight_response
+
+    return None
+
 
 def get_class_routes(controller: Any) -> List[Route]:
     if isinstance(controller, type):
@@ -1,85 +1,338 @@
 import asyncio
-from typing import Any, Awaitable, Callable, Dict
+from time import perf_counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from urllib import parse
 
-from ..exceptions import MethodNotFoundError, PathNotFoundError
-from .base import ASGIApp, Receiver, Scope, Sender
+from ..bodies import (
+    MAX_DECOMPRESSED_BODY_SIZE,
+    BodyDecoder,
+    BodyStream,
+    make_body_decoder,
+)
+from ..exceptions import (
+    BodyDecodingError,
+    MethodNotFoundError,
+    PathNotFoundError,
+    PayloadTooLargeError,
+    QueryTooLongError,
+    TooManyQueryArgsError,
+    UnsupportedBodyEncodingError,
+)
+from ..instrumentation import (
+    BODY,
+    METHOD_NOT_FOUND,
+    PATH_NOT_FOUND,
+    ROUTING,
+    SEND,
+    Instrumentation,
+)
+from ..pool import ObjectPool
+from ..request import Request
+from .base import ASGIApp, ASGIResponse, Receiver, Scope, Sender
 from .request import AsgiRequest
 from .responses import (
+    send_invalid_body_encoding_response,
     send_method_not_allowed_response,
     send_not_found,
+    send_payload_too_large_response,
     send_response,
+    send_too_many_query_args_response,
+    send_unsupported_body_encoding_response,
+    send_uri_too_long_response,
 )
 from .router import ResolvedRoute
 
 
-def asgi_app(router: Callable[[str, str], ResolvedRoute]) -> ASGIApp:
+Preflight = Callable[[bytes, bytes], ASGIResponse]
+LifespanHook = Callable[[], Awaitable[Any]]
+
+
+def asgi_app(
+    router: Callable[[str, str], ResolvedRoute],
+    max_body_size: Optional[int] = None,
+    max_decompressed_body_size: Optional[int] = MAX_DECOMPRESSED_BODY_SIZE,
+    preflight: Optional[Preflight] = None,
+    pool_size: int = 0,
+    instrumentation: Optional[Instrumentation] = None,
+    startup: Sequence[LifespanHook] = (),
+    shutdown: Sequence[LifespanHook] = (),
+) -> ASGIApp:
+    asgi_requests_pool: ObjectPool[AsgiRequest] = ObjectPool(
+        AsgiRequest, pool_size
+    )
+    requests_pool: Optional[ObjectPool[Request]] = (
+        ObjectPool(Request, pool_size) if pool_size else None
+    )
+
     async def controller(
         scope: Scope, receive: Receiver, send: Sender
     ) -> None:
+        if scope['type'] == 'lifespan':
+            await _run_lifespan(receive, send, startup, shutdown)
+            return
+
+        if instrumentation:
+            started_at = perf_counter()
+
         try:
             resolved = router(scope['path'], scope['method'])
 
         except PathNotFoundError:
+            if instrumentation:
+                instrumentation.record(
+                    PATH_NOT_FOUND, ROUTING, perf_counter() - started_at
+                )
+
             await send_not_found(send)
 
         except MethodNotFoundError:
+            if instrumentation:
+                instrumentation.record(
+                    METHOD_NOT_FOUND, ROUTING, perf_counter() - started_at
+                )
+
+            if preflight and scope['method'] == 'OPTIONS':
+                preflight_response = _get_preflight_response(
+                    preflight, scope['headers']
+                )
+
+                if preflight_response is not None:
+                    await send_response(send, preflight_response, b'')
+                    return
+
             await send_method_not_allowed_response(send)
 
         else:
             route = resolved.route
 
+            if instrumentation:
+                stage_started_at = perf_counter()
+                instrumentation.record(
+                    route.path_pattern, ROUTING, stage_started_at - started_at
+                )
+
             if route.has_headers:
                 headers = scope['headers']
             else:
                 headers = []
 
-            if route.has_query:
-                query_dict = _get_query_dict(scope)
-            else:
-                query_dict = {}
+            try:
+                if route.query_parser:
+                    query_dict = route.query_parser(scope['query_string'])
+                elif route.has_query:
+                    query_dict = _get_query_dict(scope)
+                else:
+                    query_dict = {}
 
-            if route.has_body:
-                body = await _read_body(receive)
-            else:
-                body = b''
-
-            response_and_body = route.controller(
-                AsgiRequest(
-                    path_pattern=route.path_pattern,
-                    resolved_path=resolved.path,
-                    path_args=resolved.path_args,
-                    query_dict=query_dict,
-                    headers=headers,
-                    body=body,
+                if route.has_body:
+                    body_max_size = (
+                        max_body_size
+                        if route.max_body_size is None
+                        else route.max_body_size
+                    )
+
+                    if route.has_body_stream:
+                        request_body: Union[bytes, BodyStream] = BodyStream(
+                            receive, body_max_size
+                        )
+                    else:
+                        request_body = await _read_body(
+                            receive,
+                            body_max_size,
+                            scope['headers'],
+                            None
+                            if route.has_raw_body
+                            else make_body_decoder(
+                                scope['headers'], max_decompressed_body_size
+                            ),
+                        )
+                else:
+                    request_body = b''
+
+                if instrumentation and route.has_body:
+                    body_read_at = perf_counter()
+                    instrumentation.record(
+                        route.path_pattern,
+                        BODY,
+                        body_read_at - stage_started_at,
+                    )
+
+                asgi_request = asgi_requests_pool.acquire(
+                    route.path_pattern,
+                    resolved.path,
+                    resolved.path_args,
+                    query_dict,
+                    headers,
+                    request_body,
+                    requests_pool,
                 )
-            )
+                response_and_body = route.controller(asgi_request)
 
-            while asyncio.iscoroutine(response_and_body):
-                response_and_body = await response_and_body
+                while asyncio.iscoroutine(response_and_body):
+                    response_and_body = await response_and_body
+
+            except PayloadTooLargeError:
+                await send_payload_too_large_response(send)
+                return
+
+            except BodyDecodingError:
+                await send_invalid_body_encoding_response(send)
+                return
+
+            except UnsupportedBodyEncodingError:
+                await send_unsupported_body_encoding_response(send)
+                return
+
+            except QueryTooLongError:
+                await send_uri_too_long_response(send)
+                return
+
+            except TooManyQueryArgsError:
+                await send_too_many_query_args_response(send)
+                return
 
             response, body = (
                 (response_and_body[0], response_and_body[1])
                 if len(response_and_body) > 1
                 else (response_and_body[0], b'')
             )
-            await send_response(send, response, body)
+            if instrumentation:
+                stage_started_at = perf_counter()
+                await send_response(send, response, body)
+                instrumentation.record(
+                    route.path_pattern,
+                    SEND,
+                    perf_counter() - stage_started_at,
+                )
+            else:
+                await send_response(send, response, body)
+
+            if requests_pool is not None:
+                if asgi_request.request is not None:
+                    requests_pool.release(asgi_request.request)
+
+                asgi_requests_pool.release(asgi_request)
 
     return controller
 
 
+async def _run_lifespan(
+    receive: Receiver,
+    send: Sender,
+    startup: Sequence[LifespanHook],
+    shutdown: Sequence[LifespanHook],
+) -> None:
+    while True:
+        message = await receive()
+        event = message['type'].rsplit('.', 1)[-1]
+
+        if event not in ('startup', 'shutdown'):
+            continue
+
+        try:
+            for hook in startup if event == 'startup' else shutdown:
+                await hook()
+
+        except Exception as error:
+            await send(
+                {
+                    'type': f'lifespan.{event}.failed',
+                    'message': f'{type(error).__name__}: {error}',
+                }
+            )
+            raise
+
+        await send({'type': f'lifespan.{event}.complete'})
+
+        if event == 'shutdown':
+            return
+
+
+def _get_preflight_response(
+    preflight: Preflight, headers: List[Tuple[bytes, bytes]]
+) -> Optional[ASGIResponse]:
+    origin = None
+    method = None
+
+    for name, value in headers:
+        if name == b'origin':
+            origin = value
+
+        elif name == b'access-control-request-method':
+            method = value
+
+    if origin is None or method is None:
+        return None
+
+    return preflight(origin, method)
+
+
 def _get_query_dict(scope: Dict[str, Any]) -> Dict[str, Any]:
     qs = parse.parse_qs(scope['query_string'].decode())
     return qs
 
 
-async def _read_body(receive: Callable[[], Awaitable[Dict[str, Any]]]) -> Any:
-    body = b''
+async def _read_body(
+    receive: Callable[[], Awaitable[Dict[str, Any]]],
+    max_size: Optional[int] = None,
+    headers: Optional[List[Tuple[bytes, bytes]]] = None,
+    decoder: Optional[BodyDecoder] = None,
+) -> Any:
+    if max_size is not None and headers:
+        content_length = _get_content_length(headers)
+
+        if content_length is not None and content_length > max_size:
+            raise PayloadTooLargeError(content_length, max_size)
+
+    message = await receive()
+    body = message.get('body', b'')
+
+    if not message.get('more_body', False):
+        if max_size is not None and len(body) > max_size:
+            raise PayloadTooLargeError(len(body), max_size)
+
+        if decoder is not None:
+            return decoder.decode(body) + decoder.finish()
+
+        return body
+
+    chunks = [body if decoder is None else decoder.decode(body)]
+    size = len(body)
     more_body = True
 
     while more_body:
         message = await receive()
-        body += message.get('body', b'')
+        body = message.get('body', b'')
+        size += len(body)
         more_body = message.get('more_body', False)
 
-    return body
+        if max_size is not None and size > max_size:
+            raise PayloadTooLargeError(size, max_size)
+
+        chunks.append(body if decoder is None else decoder.decode(body))
+
+    if decoder is not None:
+        chunks.append(decoder.finish())
+
+    return b''.join(chunks)
+
+
+def _get_content_length(headers: List[Tuple[bytes, bytes]]) -> Optional[int]:
+    for name, value in headers:
+        if name == b'content-length':
+            try:
+                return int(value)
+            except ValueError:
+                return None
+
+    return None
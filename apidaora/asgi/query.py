@@ -0,0 +1,82 @@
+from typing import Callable, Iterable, Optional
+from urllib.parse import unquote_plus
+
+from ..cache import LRUCache
+from ..exceptions import QueryTooLongError, TooManyQueryArgsError
+from .base import ASGIQueryDict
+
+
+MAX_QUERY_ARGS = 100
+MAX_QUERY_STRING_LENGTH = 8 * 1024
+
+QueryParser = Callable[[bytes], ASGIQueryDict]
+QueryCache = LRUCache[bytes, ASGIQueryDict]
+
+
+def make_query_parser(
+    names: Iterable[str],
+    cache: Optional[QueryCache] = None,
+    max_args: int = MAX_QUERY_ARGS,
+    max_length: int = MAX_QUERY_STRING_LENGTH,
+) -> QueryParser:
+    names_map = {name.encode(): name for name in names}
+
+    def parse(query_string: bytes) -> ASGIQueryDict:
+        if len(query_string) > max_length:
+            raise QueryTooLongError(len(query_string), max_length)
+
+        if query_string.count(b'&') >= max_args:
+            raise TooManyQueryArgsError(max_args)
+
+        query_dict: ASGIQueryDict = {}
+
+        for part in query_string.split(b'&'):
+            name, _, value = part.partition(b'=')
+
+            if not value:
+                continue
+
+            if b'%' in name or b'+' in name:
+                name = unquote_plus(name.decode(errors='replace')).encode()
+
+            arg_name = names_map.get(name)
+
+            if arg_name is not None:
+                query_dict.setdefault(arg_name, []).append(
+                    decode_query_value(value)
+                )
+
+        return query_dict
+
+    if cache is None:
+
+        def parse_query(query_string: bytes) -> ASGIQueryDict:
+            if not query_string:
+                return {}
+
+            return parse(query_string)
+
+        return parse_query
+
+    queries_cache = cache
+
+    def parse_cached_query(query_string: bytes) -> ASGIQueryDict:
+        if not query_string:
+            return {}
+
+        query_dict = queries_cache.get(query_string)
+
+        if query_dict is None:
+            query_dict = parse(query_string)
+            queries_cache.set(query_string, query_dict)
+
+        return {name: values.copy() for name, values in query_dict.items()}
+
+    return parse_cached_query
+
+
+def decode_query_value(value: bytes) -> str:
+    if b'%' in value or b'+' in value:
+        return unquote_plus(value.decode(errors='replace'))
+
+    return value.decode(errors='replace')
@@ -1,12 +1,61 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..bodies import BodyStream
+from ..pool import ObjectPool
 
 
-@dataclass
 class AsgiRequest:
-    path_pattern: str
-    resolved_path: str
-    path_args: Dict[str, Any]
-    query_dict: Dict[str, Any]
-    headers: List[Tuple[bytes, bytes]]
-    body: bytes
+    __slots__ = (
+        'path_pattern',
+        'resolved_path',
+        'path_args',
+        'query_dict',
+        'headers',
+        'body',
+        'headers_index',
+        'request',
+        'requests_pool',
+    )
+
+    def __init__(
+        self,
+        path_pattern: str,
+        resolved_path: str,
+        path_args: Dict[str, Any],
+        query_dict: Dict[str, Any],
+        headers: List[Tuple[bytes, bytes]],
+        body: Union[bytes, BodyStream],
+        requests_pool: Optional[ObjectPool[Any]] = None,
+    ):
+        self.path_pattern = path_pattern
+        self.resolved_path = resolved_path
+        self.path_args = path_args
+        self.query_dict = query_dict
+        self.headers = headers
+        self.body = body
+        self.headers_index: Optional[Dict[bytes, bytes]] = None
+        self.request: Any = None
+        self.requests_pool = requests_pool
+
+    def __repr__(self) -> str:
+        return (
+            f'AsgiRequest(path_pattern={self.path_pattern!r}, '
+            f'resolved_path={self.resolved_path!r}, '
+            f'path_args={self.path_args!r}, '
+            f'query_dict={self.query_dict!r}, '
+            f'headers={self.headers!r}, body={self.body!r})'
+        )
+
+    def get_header(self, name: bytes) -> Optional[bytes]:
+        if self.headers_index is None:
+            self.headers_index = {}
+
+            for h_name, h_value in self.headers:
+                self.headers_index.setdefault(h_name.lower(), h_value)
+
+        return self.headers_index.get(name)
+
+    def reset(self) -> None:
+        self.path_args = self.query_dict = None  # type: ignore
+        self.headers = self.body = None  # type: ignore
+        self.headers_index = self.request = self.requests_pool = None
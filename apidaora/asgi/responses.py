@@ -1,5 +1,14 @@
+from collections.abc import AsyncIterator as AsyncIteratorABC
 from http import HTTPStatus
-from typing import Awaitable, Optional, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from ..content import ContentType
 from .base import ASGIHeaders, ASGIResponse, Sender
@@ -24,6 +33,10 @@ YAML_CONTENT_HEADER = (
     b'content-type',
     ContentType.APPLICATION_YAML.value.encode(),
 )
+NDJSON_CONTENT_HEADER = (
+    b'content-type',
+    ContentType.APPLICATION_NDJSON.value.encode(),
+)
 
 JSON_RESPONSE: ASGIResponse = {
     'type': HTTP_RESPONSE_START,
@@ -61,6 +74,12 @@ YAML_RESPONSE: ASGIResponse = {
     'headers': [YAML_CONTENT_HEADER],
 }
 
+NDJSON_RESPONSE: ASGIResponse = {
+    'type': HTTP_RESPONSE_START,
+    'status': HTTPStatus.OK.value,
+    'headers': [NDJSON_CONTENT_HEADER],
+}
+
 NOT_FOUND_RESPONSE: ASGIResponse = {
     'type': HTTP_RESPONSE_START,
     'status': HTTPStatus.NOT_FOUND.value,
@@ -79,6 +98,30 @@ METHOD_NOT_ALLOWED_RESPONSE: ASGIResponse = {
     'headers': [],
 }
 
+PAYLOAD_TOO_LARGE_RESPONSE: ASGIResponse = {
+    'type': HTTP_RESPONSE_START,
+    'status': HTTPStatus.REQUEST_ENTITY_TOO_LARGE.value,
+    'headers': [],
+}
+
+URI_TOO_LONG_RESPONSE: ASGIResponse = {
+    'type': HTTP_RESPONSE_START,
+    'status': HTTPStatus.REQUEST_URI_TOO_LONG.value,
+    'headers': [],
+}
+
+BAD_REQUEST_RESPONSE: ASGIResponse = {
+    'type': HTTP_RESPONSE_START,
+    'status': HTTPStatus.BAD_REQUEST.value,
+    'headers': [],
+}
+
+UNSUPPORTED_MEDIA_TYPE_RESPONSE: ASGIResponse = {
+    'type': HTTP_RESPONSE_START,
+    'status': HTTPStatus.UNSUPPORTED_MEDIA_TYPE.value,
+    'headers': [],
+}
+
 NO_CONTENT_RESPONSE: ASGIResponse = {
     'type': HTTP_RESPONSE_START,
     'status': HTTPStatus.NO_CONTENT.value,
@@ -95,7 +138,11 @@ def make_response(
 ) -> ASGIResponse:
     default_headers: ASGIHeaders
 
-    if content_length is None and headers is None:
+    if (
+        content_length is None
+        and headers is None
+        and status.value == default_value['status']
+    ):
         return default_value
 
     if content_length and default_content_header:
@@ -155,6 +202,20 @@ def make_yaml_response(
     )
 
 
+def make_ndjson_response(
+    content_length: Optional[int] = None,
+    status: HTTPStatus = HTTPStatus.OK,
+    headers: Optional[ASGIHeaders] = None,
+) -> ASGIResponse:
+    return make_response(
+        content_length,
+        status,
+        headers,
+        NDJSON_RESPONSE,
+        NDJSON_CONTENT_HEADER,
+    )
+
+
 def make_html_response(
     content_length: Optional[int] = None,
     status: HTTPStatus = HTTPStatus.OK,
@@ -214,17 +275,67 @@ def make_see_other_response(
 
 
 async def send_response(
-    send: Sender, response: ASGIResponse, body: bytes
+    send: Sender,
+    response: ASGIResponse,
+    body: Union[bytes, AsyncIterator[bytes]],
 ) -> None:
     await send(response)  # type: ignore
+
+    if not isinstance(body, bytes):
+        async for chunk in body:
+            if chunk:
+                await send(
+                    {
+                        'type': 'http.response.body',
+                        'body': chunk,
+                        'more_body': True,
+                    }
+                )
+
+        body = b''
+
     await send(
         {'type': 'http.response.body', 'body': body, 'more_body': False}
     )
 
 
+async def make_chunks_iterator(
+    body: Union[Iterator[Any], AsyncIterator[Any]]
+) -> AsyncIterator[bytes]:
+    if isinstance(body, AsyncIteratorABC):
+        async for chunk in body:
+            yield chunk if isinstance(chunk, bytes) else str(chunk).encode()
+
+    else:
+        for chunk in body:
+            yield chunk if isinstance(chunk, bytes) else str(chunk).encode()
+
+
 def send_not_found(send: Sender) -> Awaitable[None]:
     return send_response(send, NOT_FOUND_RESPONSE, b'')
 
 
 def send_method_not_allowed_response(send: Sender) -> Awaitable[None]:
     return send_response(send, METHOD_NOT_ALLOWED_RESPONSE, b'')
+
+
+def send_payload_too_large_response(send: Sender) -> Awaitable[None]:
+    return send_response(send, PAYLOAD_TOO_LARGE_RESPONSE, b'')
+
+
+def send_invalid_body_encoding_response(send: Sender) -> Awaitable[None]:
+    return send_response(send, BAD_REQUEST_RESPONSE, b'')
+
+
+def send_unsupported_body_encoding_response(
+    send: Sender,
+) -> Awaitable[None]:
+    return send_response(send, UNSUPPORTED_MEDIA_TYPE_RESPONSE, b'')
+
+
+def send_uri_too_long_response(send: Sender) -> Awaitable[None]:
+    return send_response(send, URI_TOO_LONG_RESPONSE, b'')
+
+
+def send_too_many_query_args_response(send: Sender) -> Awaitable[None]:
+    return send_response(send, BAD_REQUEST_RESPONSE, b'')
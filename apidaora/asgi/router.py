@@ -1,12 +1,10 @@
 import dataclasses
 import re
 from abc import ABC, abstractmethod
-from functools import lru_cache
 from logging import Logger
 from typing import (
     Any,
     Callable,
-    DefaultDict,
     Dict,
     Iterable,
     List,
@@ -16,13 +14,16 @@ from typing import (
     Union,
 )
 
+from apidaora.cache import LRUCache
 from apidaora.exceptions import (
     InvalidPathError,
+    InvalidRouteArgumentsError,
     MethodNotFoundError,
     PathNotFoundError,
 )
 from apidaora.method import MethodType
 
+from ..instrumentation import Instrumentation
 from ..middlewares import Middlewares
 from .base import (
     ASGIBody,
@@ -31,6 +32,7 @@ from .base import (
     ASGIPathArgs,
     ASGIQueryDict,
 )
+from .query import QueryParser
 from .request import AsgiRequest
 
 
@@ -38,6 +40,7 @@ class Controller(ABC):
     routes: List['Route']
     middlewares: Optional[Middlewares] = None
     logger: Optional[Logger] = None
+    instrumentation: Optional[Instrumentation] = None
 
     @abstractmethod
     def __call__(self, request: AsgiRequest) -> ASGICallableResults:
@@ -59,6 +62,10 @@ class Route:
     has_headers: bool = False
     has_body: bool = False
     has_options: bool = False
+    has_body_stream: bool = False
+    has_raw_body: bool = False
+    max_body_size: Optional[int] = None
+    query_parser: Optional[QueryParser] = None
 
 
 @dataclasses.dataclass
@@ -69,16 +76,119 @@ class ResolvedRoute:
 
 
 @dataclasses.dataclass
-class RoutesTreeRegex:
+class RoutesTreeParam:
     name: str
     compiled_re: Optional[Pattern[Any]]
+    node: 'RoutesTree'
 
 
-class RoutesTree(DefaultDict[str, Any]):
-    regex: Optional[RoutesTreeRegex] = None
+@dataclasses.dataclass
+class RoutesTree:
+    static: Dict[str, 'RoutesTree'] = dataclasses.field(default_factory=dict)
+    params: List[RoutesTreeParam] = dataclasses.field(default_factory=list)
+    methods: Dict[str, Route] = dataclasses.field(default_factory=dict)
+    path_args: List[Tuple[str, int]] = dataclasses.field(default_factory=list)
+
+    def add(self, route: Route) -> None:
+        node = self
+        path_args = []
+
+        for index, path_pattern_part in enumerate(
+            split_path(route.path_pattern)
+        ):
+            match = PATH_RE.match(path_pattern_part)
+
+            if match:
+                node = node.get_param_node(
+                    match.group('name'), match.group('pattern')
+                )
+                path_args.append((match.group('name'), index))
+            else:
+                node = node.static.setdefault(path_pattern_part, RoutesTree())
+
+        node.methods[route.method.value] = route
+        node.path_args = path_args
+
+    def get_param_node(
+        self, name: str, pattern: Optional[str]
+    ) -> 'RoutesTree':
+        for param in self.params:
+            param_pattern = (
+                param.compiled_re.pattern if param.compiled_re else None
+            )
+
+            if param.name == name and param_pattern == pattern:
+                return param.node
+
+        param = RoutesTreeParam(
+            name, re.compile(pattern) if pattern else None, RoutesTree()
+        )
+        self.params.append(param)
+        return param.node
+
+    def compile(self) -> None:
+        # constrained params are tried before the catch-all ones
+        self.params.sort(key=lambda param: param.compiled_re is None)
+
+        for node in self.static.values():
+            node.compile()
+
+        for param in self.params:
+            param.node.compile()
+
+    def match(
+        self, parts: List[str], index: int, method: Optional[str]
+    ) -> Optional['RoutesTree']:
+        node = self
+        parts_len = len(parts)
+
+        while index < parts_len:
+            part = parts[index]
+            index += 1
+            child = node.static.get(part)
+            params = node.params
+
+            if not params:
+                if child is None:
+                    return None
+
+                node = child
+                continue
+
+            if child is not None:
+                matched = child.match(parts, index, method)
+
+                if matched is not None:
+                    return matched
+
+            elif len(params) == 1:
+                param = params[0]
+
+                if param.compiled_re and not param.compiled_re.fullmatch(
+                    part
+                ):
+                    return None
+
+                node = param.node
+                continue
+
+            for param in params:
+                if param.compiled_re and not param.compiled_re.fullmatch(
+                    part
+                ):
+                    continue
+
+                matched = param.node.match(parts, index, method)
 
-    def __init__(self) -> None:
-        super().__init__(RoutesTree)
+                if matched is not None:
+                    return matched
+
+            return None
+
+        if method is None:
+            return node if node.methods else None
+
+        return node if method in node.methods else None
 
 
 PATH_RE = re.compile(r'\{(?P<name>[^/:]+)(:(?P<pattern>[^/:]+))?\}')
@@ -88,6 +198,8 @@ def make_router(
     routes: Union[List[Route], Tuple[Route]],
     middlewares: Optional[Middlewares] = None,
     logger: Optional[Logger] = None,
+    cache: Optional[LRUCache[Tuple[str, str], ResolvedRoute]] = None,
+    not_found_cache: Optional[LRUCache[str, bool]] = None,
 ) -> Callable[[str, str], ResolvedRoute]:
     has_regex_path = False
 
@@ -103,73 +215,66 @@ def make_router(
             route.controller.logger = logger
 
     if has_regex_path:
-        return make_tree_router(routes, middlewares)
+        return make_tree_router(routes, middlewares, cache, not_found_cache)
+
+    if cache is not None or not_found_cache is not None:
+        # static paths are resolved by a single dict lookup
+        raise InvalidRouteArgumentsError(
+            {'cache': cache, 'not_found_cache': not_found_cache}
+        )
 
     return make_dict_router(routes, middlewares)
 
 
 def make_tree_router(
-    routes: Iterable[Route], middlewares: Optional[Middlewares] = None,
+    routes: Iterable[Route],
+    middlewares: Optional[Middlewares] = None,
+    cache: Optional[LRUCache[Tuple[str, str], ResolvedRoute]] = None,
+    not_found_cache: Optional[LRUCache[str, bool]] = None,
 ) -> Callable[[str, str], ResolvedRoute]:
     routes_tree = RoutesTree()
 
     for route in routes:
         set_middlewares_route(route, middlewares)
-        path_pattern_parts = split_path(route.path_pattern)
-        routes_tree_tmp = routes_tree
+        routes_tree.add(route)
 
-        for path_pattern_part in path_pattern_parts:
-            match = PATH_RE.match(path_pattern_part)
-
-            if match:
-                group = match.groupdict()
-                pattern = group.get('pattern')
-                regex: Optional[Pattern[Any]] = re.compile(
-                    pattern
-                ) if pattern else None
-
-                routes_tree_tmp.regex = RoutesTreeRegex(
-                    group['name'], compiled_re=regex
-                )
-                routes_tree_tmp = routes_tree_tmp[routes_tree_tmp.regex.name]
+    routes_tree.compile()
 
-                continue
+    def route_(path: str, method: str) -> ResolvedRoute:
+        stripped_path = path.strip(STRIP_VALUES)
 
-            routes_tree_tmp = routes_tree_tmp[path_pattern_part]
+        if cache is not None:
+            resolved = cache.get((path, method))
 
-        routes_tree_tmp[route.method.value] = route
+            if resolved:
+                return resolved
 
-    @lru_cache(maxsize=1024 * 1024)
-    def route_(path: str, method: str) -> ResolvedRoute:
-        path_parts = split_path(path)
-        path_args = {}
-        routes_tree_ = routes_tree
+        if not_found_cache is not None and not_found_cache.get(stripped_path):
+            raise PathNotFoundError(path)
 
-        for path_part in path_parts:
-            if path_part in routes_tree_:
-                routes_tree_ = routes_tree_[path_part]
-                continue
+        parts = stripped_path.split('/')
+        node = routes_tree.match(parts, 0, method)
 
-            if routes_tree_.regex:
-                compiled_re = routes_tree_.regex.compiled_re
-                match = compiled_re.match(path_part) if compiled_re else None
+        if node is not None:
+            path_args = {}
 
-                if not match and compiled_re:
-                    raise PathNotFoundError(path)
+            for name, index in node.path_args:
+                path_args[name] = parts[index]
 
-                path_args[routes_tree_.regex.name] = path_part
-                routes_tree_ = routes_tree_[routes_tree_.regex.name]
+            resolved = ResolvedRoute(node.methods[method], path_args, path)
 
-                continue
+            if cache is not None:
+                cache.set((path, method), resolved)
 
-            raise PathNotFoundError(path)
+            return resolved
 
-        if method not in routes_tree_:
+        if routes_tree.match(parts, 0, None):
             raise MethodNotFoundError(method, path)
 
-        return ResolvedRoute(
-            route=routes_tree_[method], path_args=path_args, path=path
-        )
+        if not_found_cache is not None:
+            not_found_cache.set(stripped_path, True)
+
+        raise PathNotFoundError(path)
 
     return route_
 
@@ -177,25 +282,28 @@ def make_tree_router(
 def make_dict_router(
     routes: Iterable[Route], middlewares: Optional[Middlewares] = None,
 ) -> Callable[[str, str], ResolvedRoute]:
-    routes_dict = {}
+    routes_dict: Dict[str, Dict[str, ResolvedRoute]] = {}
 
     for route in routes:
         set_middlewares_route(route, middlewares)
         path = route.path_pattern.strip(STRIP_VALUES)
-        routes_dict[(path, route.method.value)] = ResolvedRoute(
+        routes_dict.setdefault(path, {})[route.method.value] = ResolvedRoute(
             route, {}, path
         )
 
     def route_(path: str, method: str) -> ResolvedRoute:
-        try:
-            return routes_dict[(path.strip(STRIP_VALUES), method)]
-
-        except KeyError:
-            if any([path in k for k in routes_dict.keys()]):
-                raise MethodNotFoundError(method, path)
+        methods = routes_dict.get(path.strip(STRIP_VALUES))
 
+        if methods is None:
             raise PathNotFoundError(path)
 
+        resolved = methods.get(method)
+
+        if resolved is None:
+            raise MethodNotFoundError(method, path)
+
+        return resolved
+
     return route_
 
 
@@ -208,17 +316,17 @@ def set_middlewares_route(
             or not route.controller.middlewares
         ):
             route.controller.middlewares = Middlewares(
-                pre_execution=middlewares.pre_execution,
-                post_execution=middlewares.post_execution,
+                pre_execution=list(middlewares.pre_execution),
+                post_execution=list(middlewares.post_execution),
             )
         else:
-            route_middlewares = Middlewares(
-                pre_execution=route.controller.middlewares.pre_execution,
-                post_execution=route.controller.middlewares.post_execution,
+            route_middlewares = route.controller.middlewares
+            route.controller.middlewares = Middlewares(
+                pre_execution=route_middlewares.pre_execution
+                + middlewares.pre_execution,
+                post_execution=route_middlewares.post_execution
+                + middlewares.post_execution,
             )
-            route_middlewares.pre_execution.extend(middlewares.pre_execution)
-            route_middlewares.post_execution.extend(middlewares.post_execution)
-            route.controller.middlewares = route_middlewares
 
 
 def split_path(path: str) -> Iterable[str]:
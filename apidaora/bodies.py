@@ -1,8 +1,15 @@
 import io
-from typing import IO, Optional
+import zlib
+from typing import IO, Any, Awaitable, Callable, Dict, List, Optional
 
 from dictdaora import DictDaora
 
+from .exceptions import (
+    BodyDecodingError,
+    PayloadTooLargeError,
+    UnsupportedBodyEncodingError,
+)
+
 
 try:
     import gzip
@@ -10,6 +17,15 @@ except Exception:
     gzip = None  # type: ignore
 
 
+MAX_DECOMPRESSED_BODY_SIZE = 64 * 1024 * 1024
+IDENTITY_ENCODING = b'identity'
+DECODERS_WBITS = {
+    b'gzip': zlib.MAX_WBITS | 16,
+    b'x-gzip': zlib.MAX_WBITS | 16,
+    b'deflate': zlib.MAX_WBITS,
+}
+
+
 class GZipFactory(DictDaora):
     mode: str = 'rb'
     compresslevel: int = 9
@@ -30,3 +46,88 @@ class GZipFactory(DictDaora):
             )
 
         raise ValueError(self.value)
+
+
+class BodyStream:
+    def __init__(
+        self,
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        max_size: Optional[int] = None,
+    ):
+        self.receive = receive
+        self.max_size = max_size
+        self.size = 0
+        self.more_body = True
+
+    def __aiter__(self) -> 'BodyStream':
+        return self
+
+    async def __anext__(self) -> bytes:
+        if not self.more_body:
+            raise StopAsyncIteration()
+
+        message = await self.receive()
+        chunk: bytes = message.get('body', b'')
+        self.more_body = message.get('more_body', False)
+        self.size += len(chunk)
+
+        if self.max_size is not None and self.size > self.max_size:
+            self.more_body = False
+            raise PayloadTooLargeError(self.size, self.max_size)
+
+        return chunk
+
+    async def read(self) -> bytes:
+        chunks: List[bytes] = [chunk async for chunk in self]
+        return b''.join(chunks)
+
+
+class BodyDecoder:
+    def __init__(self, encoding: bytes, max_size: Optional[int] = None):
+        self.decompressor = zlib.decompressobj(DECODERS_WBITS[encoding])
+        self.max_size = max_size
+        self.size = 0
+
+    def decode(self, chunk: bytes) -> bytes:
+        try:
+            if self.max_size is None:
+                data = self.decompressor.decompress(chunk)
+            else:
+                data = self.decompressor.decompress(
+                    chunk, self.max_size - self.size + 1
+                )
+        except zlib.error as error:
+            raise BodyDecodingError(*error.args)
+
+        self.size += len(data)
+
+        if self.max_size is not None and self.size > self.max_size:
+            raise PayloadTooLargeError(self.size, self.max_size)
+
+        return data
+
+    def finish(self) -> bytes:
+        data = self.decode(b'')
+
+        if not self.decompressor.eof:
+            raise BodyDecodingError('truncated body')
+
+        return data
+
+
+def make_body_decoder(
+    headers: List[Any], max_size: Optional[int] = None
+) -> Optional[BodyDecoder]:
+    for name, value in headers:
+        if name == b'content-encoding':
+            encoding = value.strip().lower()
+
+            if encoding in DECODERS_WBITS:
+                return BodyDecoder(encoding, max_size)
+
+            if encoding and encoding != IDENTITY_ENCODING:
+                raise UnsupportedBodyEncodingError(encoding)
+
+            return None
+
+    return None
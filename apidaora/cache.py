@@ -0,0 +1,77 @@
+import dataclasses
+from collections import OrderedDict
+from time import monotonic
+from typing import Generic, Optional, Tuple, TypeVar
+
+
+Key = TypeVar('Key')
+Value = TypeVar('Value')
+
+
+@dataclasses.dataclass
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    size: int
+
+
+class LRUCache(Generic[Key, Value]):
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.data: 'OrderedDict[Key, Tuple[Value, Optional[float]]]' = (
+            OrderedDict()
+        )
+
+    def get(self, key: Key) -> Optional[Value]:
+        try:
+            value, expires_at = self.data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        if expires_at is not None and expires_at <= monotonic():
+            del self.data[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Key, value: Value) -> None:
+        if self.maxsize <= 0:
+            return
+
+        if key in self.data:
+            self.data.move_to_end(key)
+
+        elif len(self.data) >= self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+        self.data[key] = (
+            value,
+            monotonic() + self.ttl if self.ttl is not None else None,
+        )
+
+    def clear(self) -> None:
+        self.data.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            maxsize=self.maxsize,
+            size=len(self.data),
+        )
+
+    def __len__(self) -> int:
+        return len(self.data)
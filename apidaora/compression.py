@@ -0,0 +1,235 @@
+import dataclasses
+import hashlib
+import zlib
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from .asgi.base import ASGIApp, ASGIHeaders, Receiver, Scope, Sender
+from .cache import LRUCache
+from .content import ContentType
+
+
+try:
+    import brotli
+except Exception:
+    brotli = None
+
+
+GZIP = 'gzip'
+DEFLATE = 'deflate'
+BROTLI = 'br'
+VARY_HEADER = (b'vary', b'accept-encoding')
+COMPRESSIBLE_CONTENT_TYPES = frozenset(
+    content_type.value.split(';')[0].encode() for content_type in ContentType
+)
+
+CompressedBodiesCache = LRUCache[Tuple[str, int, bytes], bytes]
+
+
+class Compressor:
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+
+        if encoding == BROTLI:
+            self.compressor = brotli.Compressor(quality=level)
+            self.compress_ = self.compressor.process
+            self.finish_ = self.compressor.finish
+            self.flush_ = self.compressor.flush
+
+        else:
+            wbits = zlib.MAX_WBITS | 16 if encoding == GZIP else zlib.MAX_WBITS
+            self.compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+            self.compress_ = self.compressor.compress
+            self.finish_ = self.compressor.flush
+            self.flush_ = self.flush_zlib
+
+    def compress(self, data: bytes, more_data: bool) -> bytes:
+        if more_data:
+            return self.compress_(data) + self.flush_()  # type: ignore
+
+        return self.compress_(data) + self.finish_()  # type: ignore
+
+    def flush_zlib(self) -> bytes:
+        return self.compressor.flush(zlib.Z_SYNC_FLUSH)  # type: ignore
+
+
+@dataclasses.dataclass
+class Compression:
+    min_size: int = 500
+    level: int = 6
+    levels: Dict[Union[ContentType, str], int] = dataclasses.field(
+        default_factory=dict
+    )
+    encodings: Sequence[str] = (BROTLI, GZIP, DEFLATE)
+    cache: Optional[CompressedBodiesCache] = dataclasses.field(
+        default_factory=lambda: LRUCache(maxsize=128)
+    )
+    cache_max_body_size: int = 256 * 1024
+
+    def __post_init__(self) -> None:
+        self.encodings = tuple(
+            encoding
+            for encoding in self.encodings
+            if encoding != BROTLI or brotli is not None
+        )
+        self.content_types_levels = {
+            (
+                content_type.value
+                if isinstance(content_type, ContentType)
+                else content_type
+            )
+            .split(';')[0]
+            .encode(): level
+            for content_type, level in self.levels.items()
+        }
+
+    def __call__(self, app: ASGIApp) -> ASGIApp:
+        async def compression_app(
+            scope: Scope, receive: Receiver, send: Sender
+        ) -> None:
+            if scope['type'] != 'http':
+                await app(scope, receive, send)
+                return
+
+            encoding = self.get_encoding(scope['headers'])
+            await app(scope, receive, self.make_sender(send, encoding))
+
+        return compression_app
+
+    def get_encoding(self, headers: ASGIHeaders) -> Optional[str]:
+        for name, value in headers:
+            if name == b'accept-encoding':
+                accepted = parse_accept_encoding(value)
+                any_quality = accepted.get('*', 0.0)
+
+                for encoding in self.encodings:
+                    if accepted.get(encoding, any_quality) > 0:
+                        return encoding
+
+                return None
+
+        return None
+
+    def get_level(self, headers: ASGIHeaders) -> Optional[int]:
+        content_type = None
+
+        for name, value in headers:
+            if name == b'content-encoding':
+                return None
+
+            if name == b'content-type':
+                content_type = value.split(b';')[0].strip()
+
+        if content_type not in COMPRESSIBLE_CONTENT_TYPES and (
+            content_type not in self.content_types_levels
+        ):
+            return None
+
+        return self.content_types_levels.get(content_type, self.level)
+
+    def make_sender(self, send: Sender, encoding: Optional[str]) -> Sender:
+        start: Dict[str, Any] = {}
+        compressor: Optional[Compressor] = None
+        passthrough = False
+
+        async def sender(message: Dict[str, Any]) -> None:
+            nonlocal compressor, passthrough
+
+            if message['type'] == 'http.response.start':
+                start.update(message)
+                return
+
+            if passthrough or message['type'] != 'http.response.body':
+                await send(message)
+                return
+
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+            if compressor is not None:
+                await send(
+                    {
+                        'type': 'http.response.body',
+                        'body': compressor.compress(body, more_body),
+                        'more_body': more_body,
+                    }
+                )
+                return
+
+            headers = start['headers']
+            level = self.get_level(headers)
+
+            if level is None or (not more_body and len(body) < self.min_size):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            if encoding is None:
+                passthrough = True
+                await send({**start, 'headers': [*headers, VARY_HEADER]})
+                await send(message)
+                return
+
+            headers = make_compressed_headers(headers, encoding)
+
+            if more_body:
+                compressor = Compressor(encoding, level)
+                body = compressor.compress(body, more_body)
+
+            else:
+                body = self.compress(body, encoding, level)
+                headers.append((b'content-length', str(len(body)).encode()))
+
+            await send({**start, 'headers': headers})
+            await send(
+                {
+                    'type': 'http.response.body',
+                    'body': body,
+                    'more_body': more_body,
+                }
+            )
+
+        return sender
+
+    def compress(self, body: bytes, encoding: str, level: int) -> bytes:
+        if self.cache is None or len(body) > self.cache_max_body_size:
+            return Compressor(encoding, level).compress(body, False)
+
+        key = (encoding, level, hashlib.blake2b(body, digest_size=16).digest())
+        compressed_body = self.cache.get(key)
+
+        if compressed_body is None:
+            compressed_body = Compressor(encoding, level).compress(body, False)
+            self.cache.set(key, compressed_body)
+
+        return compressed_body
+
+
+def parse_accept_encoding(value: bytes) -> Dict[str, float]:
+    accepted = {}
+
+    for part in value.decode(errors='replace').split(','):
+        encoding, _, params = part.partition(';')
+        params = params.replace(' ', '')
+        quality = 1.0
+
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+
+        accepted[encoding.strip().lower()] = quality
+
+    return accepted
+
+
+def make_compressed_headers(
+    headers: ASGIHeaders, encoding: str
+) -> ASGIHeaders:
+    compressed_headers = [
+        header for header in headers if header[0] != b'content-length'
+    ]
+    compressed_headers.append((b'content-encoding', encoding.encode()))
+    compressed_headers.append(VARY_HEADER)
+    return compressed_headers
@@ -4,6 +4,7 @@ from enum import Enum
 class ContentType(Enum):
     APPLICATION_JSON = 'application/json'
     APPLICATION_YAML = 'application/x-yaml'
+    APPLICATION_NDJSON = 'application/x-ndjson'
     TEXT_HTML = 'text/html; charset=utf-8'
     TEXT_PLAIN = 'text/plain'
     TEXT_CSS = 'text/css'
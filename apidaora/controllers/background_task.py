@@ -2,12 +2,20 @@ import asyncio
 import dataclasses
 import datetime
 import hashlib
+import importlib
 import logging
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from enum import Enum
 from functools import partial
+from heapq import heapify, heappop, heappush
 from http import HTTPStatus
+from time import monotonic
 from typing import (
     Any,
     Awaitable,
@@ -16,15 +24,23 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
+    Tuple,
     Type,
     TypedDict,
+    Union,
 )
 
 import orjson
 from jsondaora import as_typed_dict, jsondaora, typed_dict_asjson
 
+from ..asgi.query import QueryCache
 from ..asgi.router import Controller
-from ..exceptions import BadRequestError, InvalidTasksRepositoryError
+from ..exceptions import (
+    BadRequestError,
+    InvalidRouteArgumentsError,
+    InvalidTasksRepositoryError,
+)
 from ..header import Header, LocationHeader
 from ..method import MethodType
 from ..middlewares import Middlewares
@@ -41,6 +57,20 @@ except Exception:
     aioredis = None
 
 
+LifespanHook = Callable[[], Awaitable[Any]]
+
+REDIS_POOL_MINSIZE = 1
+REDIS_POOL_MAXSIZE = 10
+LOCK_TTL = 60 * 60
+RESULT_TTL = 24 * 60 * 60
+MAX_FINISHED_TASKS = 10000
+THREAD_EXECUTOR = 'thread'
+PROCESS_EXECUTOR = 'process'
+
+BACKGROUND_CONTROLLERS: Dict[str, Callable[..., Any]] = {}
+RUNNING_TASKS: Set['asyncio.Task[Any]'] = set()
+
+
 class TaskStatusType(Enum):
     RUNNING = 'running'
     FINISHED = 'finished'
@@ -60,6 +90,8 @@ class TaskInfo(TypedDict):
 class BackgroundTask:
     create: Controller
     get_results: Controller
+    startup: Optional[LifespanHook] = None
+    shutdown: Optional[LifespanHook] = None
 
 
 def make_background_task(
@@ -71,8 +103,19 @@ def make_background_task(
     lock_args: bool = False,
     middlewares: Optional[Middlewares] = None,
     options: bool = False,
+    max_body_size: Optional[int] = None,
+    query_cache: Optional[QueryCache] = None,
+    tasks_repository_pool_minsize: int = REDIS_POOL_MINSIZE,
+    tasks_repository_pool_maxsize: int = REDIS_POOL_MAXSIZE,
+    lock_ttl: Optional[int] = LOCK_TTL,
+    result_ttl: Optional[int] = RESULT_TTL,
+    executor: Union[str, Executor] = THREAD_EXECUTOR,
 ) -> BackgroundTask:
     if asyncio.iscoroutinefunction(controller):
+        if executor != THREAD_EXECUTOR:
+            # async tasks run on the event loop, never on an executor
+            raise InvalidRouteArgumentsError({'executor': executor})
+
         logger.warning(
             'Async tasks can potentially block your application, use with care. '
             'It use is recommended just for small tasks or non-blocking operations.'
@@ -89,8 +132,21 @@ def make_background_task(
             ]
         ).encode()
     ).hexdigest()[:12]
+    controller_key = (
+        f'{controller.__module__}.{controller.__qualname__}:{path_pattern}'
+    )
+    BACKGROUND_CONTROLLERS[controller_key] = controller
+    task_executor = (
+        None
+        if asyncio.iscoroutinefunction(controller)
+        else make_executor(executor, max_workers)
+    )
     tasks_repository_builder = get_tasks_repository_builder(
-        tasks_repository_uri, signature
+        tasks_repository_uri,
+        signature,
+        tasks_repository_pool_minsize,
+        tasks_repository_pool_maxsize,
+        result_ttl,
     )
 
     @jsondaora
@@ -102,15 +158,26 @@ def make_background_task(
         controller,
         tasks_repository_builder,
         FinishedTaskInfo,
-        max_workers,
         lock,
         lock_args,
         signature,
+        controller_key,
+        lock_ttl,
+        task_executor,
     )
     get_task_results = make_get_task_results(
         tasks_repository_builder, FinishedTaskInfo
     )
 
+    startup, shutdown = get_tasks_repository_lifespan_hooks(
+        tasks_repository_uri,
+        tasks_repository_pool_minsize,
+        tasks_repository_pool_maxsize,
+    )
+
+    if task_executor is not None and task_executor is not executor:
+        shutdown = make_executor_shutdown(task_executor, shutdown)
+
     create_task.__annotations__ = {
         name: type_ for name, type_ in annotations.items() if name != 'return'
     }
@@ -125,6 +192,8 @@ def make_background_task(
             create_task,
             route_middlewares=middlewares,
             options=options,
+            max_body_size=max_body_size,
+            query_cache=query_cache,
         ).controller,
         make_route(
             path_pattern,
@@ -133,6 +202,8 @@ def make_background_task(
             route_middlewares=middlewares,
             options=options,
         ).controller,
+        startup,
+        shutdown,
     )
 
 
@@ -144,11 +215,17 @@ def get_iso_time() -> str:
     )
 
 
-def get_tasks_repository_builder(uri: Optional[str], signature: str) -> Any:
+def get_tasks_repository_builder(
+    uri: Optional[str],
+    signature: str,
+    pool_minsize: int = REDIS_POOL_MINSIZE,
+    pool_maxsize: int = REDIS_POOL_MAXSIZE,
+    result_ttl: Optional[int] = RESULT_TTL,
+) -> Any:
     if uri is None:
 
         async def builder() -> SimpleTasksRepository:
-            return SimpleTasksRepository(signature, TASKS_DB)
+            return SimpleTasksRepository(signature, TASKS_DB, result_ttl)
 
         return builder
 
@@ -157,22 +234,45 @@ def get_tasks_repository_builder(uri: Optional[str], signature: str) -> Any:
             raise InvalidTasksRepositoryError("'aioredis' package not found!")
 
         return partial(
-            get_redis_tasks_repository, signature=signature, uri=uri,
+            get_redis_tasks_repository,
+            signature=signature,
+            uri=uri,
+            pool_minsize=pool_minsize,
+            pool_maxsize=pool_maxsize,
+            result_ttl=result_ttl,
         )
 
     raise InvalidTasksRepositoryError(uri)
 
 
+def get_tasks_repository_lifespan_hooks(
+    uri: Optional[str], pool_minsize: int, pool_maxsize: int
+) -> Tuple[Optional[LifespanHook], Optional[LifespanHook]]:
+    if uri is None or aioredis is None:
+        return None, None
+
+    return (
+        partial(get_redis_pool, uri, pool_minsize, pool_maxsize),
+        close_redis_pools,
+    )
+
+
 def make_create_task(
     controller: Callable[..., Any],
     tasks_repository_builder: Callable[[], Awaitable['BaseTasksRepository']],
     finished_task_info_cls: Any,
-    max_workers: int,
     lock: bool,
     lock_args: bool,
     signature: str,
+    controller_key: str,
+    lock_ttl: Optional[int] = LOCK_TTL,
+    executor: Optional[Executor] = None,
 ) -> Callable[..., Coroutine[Any, Any, Response]]:
-    executor = ThreadPoolExecutor(max_workers)
+    task_controller = (
+        controller
+        if executor is None
+        else make_executor_controller(executor, controller, controller_key)
+    )
 
     async def create_task(*args: Any, **kwargs: Any) -> Response:
         task_id = str(uuid.uuid4())
@@ -198,57 +298,49 @@ def make_create_task(
             ).hexdigest()[:12]
 
         tasks_repository = await tasks_repository_builder()
-        lock_response = await make_lock_response(
-            tasks_repository, task_id, lock, args_signature, resolved_path
+        task = TaskInfo(
+            task_id=str(task_id),
+            start_time=get_iso_time(),
+            status=TaskStatusType.RUNNING.value,
+            signature=signature,
+            args_signature=args_signature,
         )
 
-        if lock_response:
-            await tasks_repository.close()
-            return lock_response
-
-        if lock:
-            await tasks_repository.set_locked_task_id(task_id)
-        elif args_signature:
-            await tasks_repository.set_locked_task_id(task_id, args_signature)
-
-        if asyncio.iscoroutinefunction(controller):
-            wrapper_async = make_controller_wrapper_async(
-                tasks_repository_builder,
-                task_id,
-                lock,
-                args_signature,
-                finished_task_info_cls,
-                controller,
-                *args,
-                **kwargs,
-            )
-            task_ = asyncio.create_task(wrapper_async())
-            task_.add_done_callback(lambda f: f.result())
-
-        else:
-            wrapper = make_controller_wrapper(
-                tasks_repository_builder,
+        if lock or args_signature:
+            locked_task_id = await tasks_repository.create_locked(
+                task,
                 task_id,
-                lock,
-                args_signature,
                 finished_task_info_cls,
-                controller,
-                *args,
-                **kwargs,
+                None if lock else args_signature,
+                lock_ttl,
             )
-            future = executor.submit(wrapper)
-            future.add_done_callback(lambda f: f.result())
 
-        start_time = get_iso_time()
+            if locked_task_id:
+                await tasks_repository.close()
+                return make_lock_response(
+                    locked_task_id,
+                    LockType.SIGNATURE if lock else LockType.ARGS_SIGNATURE,
+                    resolved_path,
+                )
 
-        task = TaskInfo(
-            task_id=str(task_id),
-            start_time=start_time,
-            status=TaskStatusType.RUNNING.value,
-            signature=signature,
-            args_signature=args_signature,
+        else:
+            await tasks_repository.set(task, task_id, finished_task_info_cls)
+
+        wrapper_async = make_controller_wrapper_async(
+            tasks_repository_builder,
+            task,
+            lock,
+            args_signature,
+            finished_task_info_cls,
+            task_controller,
+            *args,
+            **kwargs,
         )
-        await tasks_repository.set(task, task_id, finished_task_info_cls)
+        task_ = asyncio.create_task(wrapper_async())
+        RUNNING_TASKS.add(task_)
+        task_.add_done_callback(RUNNING_TASKS.discard)
+        task_.add_done_callback(lambda f: f.cancelled() or f.result())
+
         await tasks_repository.close()
 
         return json(task, status=HTTPStatus.ACCEPTED)
@@ -256,77 +348,89 @@ def make_create_task(
     return create_task
 
 
-def make_controller_wrapper_async(
-    tasks_repository_builder: Callable[[], Awaitable['BaseTasksRepository']],
-    task_id: str,
-    lock: bool,
-    args_signature: Optional[str],
-    finished_task_info_cls: Any,
-    controller: Any,
-    *args: Any,
-    **kwargs: Any,
-) -> Callable[..., Coroutine[Any, Any, TaskInfo]]:
-    async def wrapper() -> Any:
-        tasks_repository = await tasks_repository_builder()
+def make_executor(
+    executor: Union[str, Executor], max_workers: int
+) -> Executor:
+    if executor == THREAD_EXECUTOR:
+        return ThreadPoolExecutor(max_workers)
 
-        try:
-            result = await controller(*args, **kwargs)
-            status = TaskStatusType.FINISHED.value
-        except Exception as error:
-            logger.exception(
-                f'signature={tasks_repository.signature}; '
-                f'args-signature={args_signature};'
-                f'task-id={task_id};'
-            )
-            result = {
-                'error': {
-                    'name': type(error).__name__,
-                    'args': [str(a) for a in error.args],
-                }
-            }
-            status = TaskStatusType.ERROR.value
+    if executor == PROCESS_EXECUTOR:
+        return ProcessPoolExecutor(max_workers)
 
-        task = await tasks_repository.get(task_id, finished_task_info_cls)
-        finished_task = finished_task_info_cls(
-            end_time=get_iso_time(),
-            result=result,
-            status=status,
-            task_id=task['task_id'],
-            start_time=task['start_time'],
-            signature=task['signature'],
-            args_signature=task['args_signature'],
+    if isinstance(executor, Executor):
+        return executor
+
+    raise InvalidRouteArgumentsError({'executor': executor})
+
+
+def make_executor_shutdown(
+    executor: Executor, shutdown: Optional[LifespanHook] = None
+) -> LifespanHook:
+    async def shutdown_executor() -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, executor.shutdown
         )
-        await tasks_repository.set(
-            finished_task, task_id, finished_task_info_cls
+
+        if shutdown:
+            await shutdown()
+
+    return shutdown_executor
+
+
+def make_executor_controller(
+    executor: Executor, controller: Callable[..., Any], controller_key: str
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    module = controller.__module__
+
+    if isinstance(executor, ThreadPoolExecutor):
+
+        async def thread_controller(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, partial(controller, *args, **kwargs)
+            )
+
+        return thread_controller
+
+    async def executor_controller(*args: Any, **kwargs: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            partial(call_background_controller, module, controller_key),
+            args,
+            kwargs,
         )
 
-        if lock:
-            await tasks_repository.delete_locked_task_id()
-        elif args_signature:
-            await tasks_repository.delete_locked_task_id(args_signature)
+    return executor_controller
 
-        await tasks_repository.close()
 
-    return wrapper
+def call_background_controller(
+    module: str, controller_key: str, args: Any, kwargs: Dict[str, Any]
+) -> Any:
+    controller = BACKGROUND_CONTROLLERS.get(controller_key)
+
+    if controller is None:
+        importlib.import_module(module)
+        controller = BACKGROUND_CONTROLLERS[controller_key]
 
+    return controller(*args, **kwargs)
 
-def make_controller_wrapper(
+
+def make_controller_wrapper_async(
     tasks_repository_builder: Callable[[], Awaitable['BaseTasksRepository']],
-    task_id: str,
+    task: TaskInfo,
     lock: bool,
     args_signature: Optional[str],
     finished_task_info_cls: Any,
     controller: Any,
     *args: Any,
     **kwargs: Any,
-) -> Callable[..., Any]:
-    def wrapper() -> Any:
-        policy = asyncio.get_event_loop_policy()
-        loop = policy.new_event_loop()
-        tasks_repository = loop.run_until_complete(tasks_repository_builder())
+) -> Callable[..., Coroutine[Any, Any, TaskInfo]]:
+    task_id = task['task_id']
+
+    async def wrapper() -> Any:
+        tasks_repository = await tasks_repository_builder()
 
         try:
-            result = controller(*args, **kwargs)
+            result = await controller(*args, **kwargs)
             status = TaskStatusType.FINISHED.value
         except Exception as error:
             logger.exception(
@@ -342,9 +446,6 @@ def make_controller_wrapper(
             }
             status = TaskStatusType.ERROR.value
 
-        task = loop.run_until_complete(
-            tasks_repository.get(task_id, finished_task_info_cls)
-        )
         finished_task = finished_task_info_cls(
             end_time=get_iso_time(),
             result=result,
@@ -354,21 +455,16 @@ def make_controller_wrapper(
             signature=task['signature'],
             args_signature=task['args_signature'],
         )
-
-        loop.run_until_complete(
-            tasks_repository.set(
-                finished_task, task_id, finished_task_info_cls,
-            )
+        await tasks_repository.set(
+            finished_task, task_id, finished_task_info_cls
         )
 
-        if lock:
-            loop.run_until_complete(tasks_repository.delete_locked_task_id())
-        elif args_signature:
-            loop.run_until_complete(
-                tasks_repository.delete_locked_task_id(args_signature)
+        if lock or args_signature:
+            await tasks_repository.delete_locked_task_id(
+                None if lock else args_signature, task_id
             )
 
-        loop.run_until_complete(tasks_repository.close())
+        await tasks_repository.close()
 
     return wrapper
 
@@ -402,35 +498,15 @@ def make_get_task_results(
     return get_task_results
 
 
-async def make_lock_response(
-    tasks_repository: 'BaseTasksRepository',
-    task_id: str,
-    lock: bool,
-    args_signature: Optional[str],
-    resolved_path: str,
-) -> Optional[Response]:
-    headers: List[Header] = []
-    locked_task_id = None
-    lock_type = None
-
-    if lock:
-        locked_task_id = await tasks_repository.get_locked_task_id()
-        lock_type = LockType.SIGNATURE
-
-    elif args_signature:
-        locked_task_id = await tasks_repository.get_locked_task_id(
-            args_signature
-        )
-        lock_type = LockType.ARGS_SIGNATURE
-
-    if locked_task_id and lock_type:
-        headers.append(
-            LocationHeader(f'{resolved_path}?task_id={locked_task_id}')
-        )
-        headers.append(LockHeader(lock_type.value))
-        return see_other(headers=headers)
-
-    return None
+def make_lock_response(
+    locked_task_id: str, lock_type: 'LockType', resolved_path: str
+) -> Response:
+    return see_other(
+        headers=[
+            LocationHeader(f'{resolved_path}?task_id={locked_task_id}'),
+            LockHeader(lock_type.value),
+        ]
+    )
 
 
 class LockHeader(Header, type=str, http_name='x-apidaora-lock'):
@@ -446,6 +522,7 @@ class LockType(Enum):
 class BaseTasksRepository:
     signature: str
     data_source: Any
+    result_ttl: Optional[int] = None
 
     async def set(
         self, value: Any, task_id: str, task_cls: Type[Any] = TaskInfo,
@@ -456,15 +533,37 @@ class BaseTasksRepository:
         raise NotImplementedError()
 
     async def set_locked_task_id(
-        self, task_id: str, args_signature: Optional[str] = None
+        self,
+        task_id: str,
+        args_signature: Optional[str] = None,
+        lock_ttl: Optional[int] = None,
     ) -> None:
         raise NotImplementedError()
 
     async def delete_locked_task_id(
-        self, args_signature: Optional[str] = None
+        self,
+        args_signature: Optional[str] = None,
+        task_id: Optional[str] = None,
     ) -> None:
         raise NotImplementedError()
 
+    async def create_locked(
+        self,
+        value: Any,
+        task_id: str,
+        task_cls: Type[Any] = TaskInfo,
+        args_signature: Optional[str] = None,
+        lock_ttl: Optional[int] = None,
+    ) -> Optional[str]:
+        locked_task_id = await self.get_locked_task_id(args_signature)
+
+        if locked_task_id:
+            return locked_task_id
+
+        await self.set_locked_task_id(task_id, args_signature, lock_ttl)
+        await self.set(value, task_id, task_cls)
+        return None
+
     async def close(self) -> None:
         ...
 
@@ -485,43 +584,90 @@ class BaseTasksRepository:
 
 @dataclasses.dataclass
 class SimpleTasksRepository(BaseTasksRepository):
-    data_source: Dict[str, Any]
+    data_source: 'TasksDB'
 
     async def set(
         self, value: Any, task_id: str, task_cls: Type[Any] = TaskInfo,
     ) -> None:
-        self.data_source[self.build_key(task_id)] = value
+        if value['status'] == TaskStatusType.RUNNING.value:
+            self.data_source[self.build_key(task_id)] = value
+        else:
+            self.data_source.set_finished(
+                self.build_key(task_id), value, self.result_ttl
+            )
 
     async def get(self, task_id: str, finished_task_cls: Type[Any]) -> Any:
-        return self.data_source[self.build_key(task_id)]
+        return self.data_source.get_task(self.build_key(task_id))
 
     async def set_locked_task_id(
-        self, task_id: str, args_signature: Optional[str] = None
+        self,
+        task_id: str,
+        args_signature: Optional[str] = None,
+        lock_ttl: Optional[int] = None,
     ) -> None:
-        self.data_source[self.build_lock_key(args_signature)] = task_id
+        self.data_source.set_lock(
+            self.build_lock_key(args_signature), task_id, lock_ttl
+        )
 
     async def get_locked_task_id(
         self, args_signature: Optional[str] = None
     ) -> Optional[str]:
-        return self.data_source.get(self.build_lock_key(args_signature))
+        return self.data_source.get_lock(self.build_lock_key(args_signature))
 
     async def delete_locked_task_id(
-        self, args_signature: Optional[str] = None
+        self,
+        args_signature: Optional[str] = None,
+        task_id: Optional[str] = None,
     ) -> None:
-        self.data_source.pop(self.build_lock_key(args_signature), None)
+        lock_key = self.build_lock_key(args_signature)
+
+        if task_id is None or self.data_source.get_lock(lock_key) == task_id:
+            self.data_source.delete_lock(lock_key)
 
 
 if aioredis is not None:
 
+    CREATE_LOCKED_SCRIPT = '''
+        local locked_task_id = redis.call('GET', KEYS[1])
+
+        if locked_task_id then
+            return locked_task_id
+        end
+
+        if tonumber(ARGV[3]) > 0 then
+            redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+        else
+            redis.call('SET', KEYS[1], ARGV[1])
+        end
+
+        if tonumber(ARGV[4]) > 0 then
+            redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[4])
+        else
+            redis.call('SET', KEYS[2], ARGV[2])
+        end
+
+        return false
+    '''
+    DELETE_LOCK_SCRIPT = '''
+        if redis.call('GET', KEYS[1]) == ARGV[1] then
+            return redis.call('DEL', KEYS[1])
+        end
+
+        return 0
+    '''
+
     @dataclasses.dataclass
     class RedisTasksRepository(BaseTasksRepository):
         data_source: aioredis.Redis
+        shared: bool = False
 
         async def set(
             self, value: Any, task_id: str, task_cls: Type[Any] = TaskInfo,
         ) -> None:
             await self.data_source.set(
-                self.build_key(task_id), typed_dict_asjson(value, task_cls)
+                self.build_key(task_id),
+                typed_dict_asjson(value, task_cls),
+                expire=self.result_ttl or 0,
             )
 
         async def get(self, task_id: str, finished_task_cls: Type[Any]) -> Any:
@@ -541,10 +687,15 @@ if aioredis is not None:
             raise KeyError(self.build_key(task_id))
 
         async def set_locked_task_id(
-            self, task_id: str, args_signature: Optional[str] = None
+            self,
+            task_id: str,
+            args_signature: Optional[str] = None,
+            lock_ttl: Optional[int] = None,
         ) -> None:
             await self.data_source.set(
-                self.build_lock_key(args_signature), task_id
+                self.build_lock_key(args_signature),
+                task_id,
+                expire=lock_ttl or 0,
             )
 
         async def get_locked_task_id(
@@ -555,19 +706,192 @@ if aioredis is not None:
             )
 
         async def delete_locked_task_id(
-            self, args_signature: Optional[str] = None
+            self,
+            args_signature: Optional[str] = None,
+            task_id: Optional[str] = None,
         ) -> None:
-            await self.data_source.delete(self.build_lock_key(args_signature))
+            lock_key = self.build_lock_key(args_signature)
+
+            if task_id is None:
+                await self.data_source.delete(lock_key)
+            else:
+                await self.data_source.eval(
+                    DELETE_LOCK_SCRIPT, keys=[lock_key], args=[task_id]
+                )
+
+        async def create_locked(
+            self,
+            value: Any,
+            task_id: str,
+            task_cls: Type[Any] = TaskInfo,
+            args_signature: Optional[str] = None,
+            lock_ttl: Optional[int] = None,
+        ) -> Optional[str]:
+            locked_task_id = await self.data_source.eval(
+                CREATE_LOCKED_SCRIPT,
+                keys=[
+                    self.build_lock_key(args_signature),
+                    self.build_key(task_id),
+                ],
+                args=[
+                    task_id,
+                    typed_dict_asjson(value, task_cls),
+                    lock_ttl or 0,
+                    self.result_ttl or 0,
+                ],
+            )
+
+            if isinstance(locked_task_id, bytes):
+                return locked_task_id.decode()
+
+            return locked_task_id  # type: ignore
 
         async def close(self) -> None:
-            self.data_source.close()
-            await self.data_source.wait_closed()
+            if not self.shared:
+                self.data_source.close()
+                await self.data_source.wait_closed()
+
+    RedisPoolEntry = Tuple[asyncio.AbstractEventLoop, 'asyncio.Future[Any]']
+    REDIS_POOLS: Dict[str, RedisPoolEntry] = {}
 
     async def get_redis_tasks_repository(
-        signature: str, uri: str
+        signature: str,
+        uri: str,
+        pool_minsize: int = REDIS_POOL_MINSIZE,
+        pool_maxsize: int = REDIS_POOL_MAXSIZE,
+        result_ttl: Optional[int] = RESULT_TTL,
     ) -> RedisTasksRepository:
-        data_source = await aioredis.create_redis_pool(uri)
-        return RedisTasksRepository(signature, data_source)
+        data_source = await get_redis_pool(uri, pool_minsize, pool_maxsize)
+        return RedisTasksRepository(
+            signature, data_source, result_ttl, shared=True
+        )
+
+    async def get_redis_pool(
+        uri: str,
+        minsize: int = REDIS_POOL_MINSIZE,
+        maxsize: int = REDIS_POOL_MAXSIZE,
+    ) -> aioredis.Redis:
+        loop = asyncio.get_running_loop()
+        pool_entry = REDIS_POOLS.get(uri)
+
+        if pool_entry is None or pool_entry[0] is not loop:
+            pool_entry = REDIS_POOLS[uri] = (
+                loop,
+                loop.create_task(
+                    aioredis.create_redis_pool(
+                        uri, minsize=minsize, maxsize=maxsize
+                    )
+                ),
+            )
+
+        try:
+            return await asyncio.shield(pool_entry[1])
+
+        except Exception:
+            if REDIS_POOLS.get(uri) is pool_entry:
+                REDIS_POOLS.pop(uri)
+
+            raise
+
+    async def close_redis_pools() -> None:
+        loop = asyncio.get_running_loop()
+
+        for uri, (pool_loop, pool) in tuple(REDIS_POOLS.items()):
+            if pool_loop is not loop:
+                continue
+
+            REDIS_POOLS.pop(uri)
+
+            try:
+                data_source = await pool
+            except Exception:
+                continue
+
+            data_source.close()
+            await data_source.wait_closed()
+
+
+class TasksDB(Dict[str, Any]):
+    def __init__(self, max_finished_tasks: int = MAX_FINISHED_TASKS):
+        super().__init__()
+        self.max_finished_tasks = max_finished_tasks
+        self.finished_tasks: 'OrderedDict[str, Optional[float]]' = (
+            OrderedDict()
+        )
+        self.finished_tasks_expirations: List[Tuple[float, str]] = []
+        self.locks_expires_at: Dict[str, float] = {}
+
+    def set_finished(
+        self, key: str, value: Any, ttl: Optional[int] = None
+    ) -> None:
+        self.finished_tasks.pop(key, None)
+        self.evict_expired()
+
+        while len(self.finished_tasks) >= self.max_finished_tasks > 0:
+            self.pop(self.finished_tasks.popitem(last=False)[0], None)
+
+        expires_at = monotonic() + ttl if ttl else None
+        self[key] = value
+        self.finished_tasks[key] = expires_at
+
+        if expires_at is not None:
+            heappush(self.finished_tasks_expirations, (expires_at, key))
+
+            if (
+                len(self.finished_tasks_expirations)
+                > 2 * len(self.finished_tasks) + 1
+            ):
+                self.compact_expirations()
+
+    def get_task(self, key: str) -> Any:
+        expires_at = self.finished_tasks.get(key)
+
+        if expires_at is not None and expires_at <= monotonic():
+            del self.finished_tasks[key]
+            self.pop(key, None)
+
+        return self[key]
+
+    def set_lock(
+        self, key: str, task_id: str, ttl: Optional[int] = None
+    ) -> None:
+        self[key] = task_id
+
+        if ttl:
+            self.locks_expires_at[key] = monotonic() + ttl
+        else:
+            self.locks_expires_at.pop(key, None)
+
+    def get_lock(self, key: str) -> Optional[str]:
+        expires_at = self.locks_expires_at.get(key)
+
+        if expires_at is not None and expires_at <= monotonic():
+            self.delete_lock(key)
+
+        return self.get(key)
+
+    def delete_lock(self, key: str) -> None:
+        self.locks_expires_at.pop(key, None)
+        self.pop(key, None)
+
+    def evict_expired(self) -> None:
+        now = monotonic()
+        expirations = self.finished_tasks_expirations
+
+        while expirations and expirations[0][0] <= now:
+            expires_at, key = heappop(expirations)
+
+            if self.finished_tasks.get(key) == expires_at:
+                del self.finished_tasks[key]
+                self.pop(key, None)
+
+    def compact_expirations(self) -> None:
+        self.finished_tasks_expirations = [
+            (expires_at, key)
+            for key, expires_at in self.finished_tasks.items()
+            if expires_at is not None
+        ]
+        heapify(self.finished_tasks_expirations)
 
 
-TASKS_DB: Dict[str, Any] = {}
+TASKS_DB = TasksDB()
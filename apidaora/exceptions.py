@@ -16,6 +16,26 @@ class PathNotFoundError(APIDaoraError):
     ...
 
 
+class PayloadTooLargeError(APIDaoraError):
+    ...
+
+
+class BodyDecodingError(APIDaoraError):
+    ...
+
+
+class UnsupportedBodyEncodingError(APIDaoraError):
+    ...
+
+
+class QueryTooLongError(APIDaoraError):
+    ...
+
+
+class TooManyQueryArgsError(APIDaoraError):
+    ...
+
+
 class InvalidReturnError(APIDaoraError):
     def __str__(self) -> str:
         return (
@@ -1,25 +1,65 @@
-from typing import Any, ClassVar, Optional, Type
+from typing import Any, ClassVar, Optional, Tuple, Type
 
 from dictdaora import DictDaora
 from jsondaora import as_typed_dict_field
 
 
 BUILTIN_TYPE = type
+PLAIN_TYPES = (str, int, float, bool, bytes)
 
 
 class Header(DictDaora):
     type: ClassVar[Type[Any]]
     http_name: ClassVar[Optional[str]]
+    http_name_bytes: ClassVar[Optional[bytes]]
+    constant: ClassVar[bool]
 
     def __init__(self, value: Any):
-        value = as_typed_dict_field(value, 'value', type(self).type)
+        cls = type(self)
+
+        if type(value) is not cls.type or cls.type not in PLAIN_TYPES:
+            value = as_typed_dict_field(value, 'value', cls.type)
+
         super().__init__(value=value)
 
+        if cls.constant:
+            self.encode()
+
     def __init_subclass__(
-        cls, type: Type[Any], http_name: Optional[str] = None
+        cls,
+        type: Type[Any],
+        http_name: Optional[str] = None,
+        constant: bool = False,
     ) -> None:
         cls.type = type
+        cls.constant = constant
+        cls.set_http_name(http_name)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.__dict__.pop('encoded', None)
+        super().__setitem__(key, value)
+
+    @classmethod
+    def set_http_name(cls, http_name: Optional[str]) -> None:
         cls.http_name = http_name
+        cls.http_name_bytes = http_name.encode() if http_name else None
+
+    def encode(self) -> Tuple[bytes, bytes]:
+        if 'encoded' in self.__dict__:
+            encoded: Tuple[bytes, bytes] = self.__dict__['encoded']
+            return encoded
+
+        cls = type(self)
+        value = self['value']
+        encoded = (
+            cls.http_name_bytes,  # type: ignore
+            value if isinstance(value, bytes) else str(value).encode(),
+        )
+
+        if cls.constant:
+            self.__dict__['encoded'] = encoded
+
+        return encoded
 
 
 class LocationHeader(Header, type=str, http_name='location'):
@@ -0,0 +1,113 @@
+import dataclasses
+from bisect import bisect_left
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from .responses import Response, text
+
+
+ROUTING = 'routing'
+BODY = 'body'
+PARSE = 'parse'
+MIDDLEWARES = 'middlewares'
+CONTROLLER = 'controller'
+OUTPUT = 'output'
+SEND = 'send'
+
+STAGES = (ROUTING, BODY, PARSE, MIDDLEWARES, CONTROLLER, OUTPUT, SEND)
+PATH_NOT_FOUND = 'path-not-found'
+METHOD_NOT_FOUND = 'method-not-found'
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+METRIC_NAME = 'apidaora_stage_duration_seconds'
+
+TimingCallback = Callable[[str, str, float], None]
+
+
+class StageHistogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+
+@dataclasses.dataclass
+class Instrumentation:
+    callback: Optional[TimingCallback] = None
+    histograms: bool = True
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+    metrics_path: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.buckets = tuple(sorted(self.buckets))
+        self.stages_histograms: Dict[Tuple[str, str], StageHistogram] = {}
+
+    def record(self, route: str, stage: str, seconds: float) -> None:
+        if self.histograms:
+            histogram = self.stages_histograms.get((route, stage))
+
+            if histogram is None:
+                histogram = self.stages_histograms[
+                    (route, stage)
+                ] = StageHistogram(self.buckets)
+
+            histogram.observe(seconds)
+
+        if self.callback:
+            self.callback(route, stage, seconds)
+
+    def render(self) -> str:
+        lines = [
+            f'# HELP {METRIC_NAME} Time spent in each request stage.',
+            f'# TYPE {METRIC_NAME} histogram',
+        ]
+
+        for (route, stage), histogram in self.stages_histograms.items():
+            labels = f'route="{escape_label(route)}",stage="{stage}"'
+            cumulative_count = 0
+
+            for bucket, count in zip(self.buckets, histogram.counts):
+                cumulative_count += count
+                lines.append(
+                    f'{METRIC_NAME}_bucket{{{labels},le="{bucket}"}} '
+                    f'{cumulative_count}'
+                )
+
+            lines.append(
+                f'{METRIC_NAME}_bucket{{{labels},le="+Inf"}} {histogram.count}'
+            )
+            lines.append(f'{METRIC_NAME}_sum{{{labels}}} {histogram.sum}')
+            lines.append(f'{METRIC_NAME}_count{{{labels}}} {histogram.count}')
+
+        lines.append('')
+        return '\n'.join(lines)
+
+    def metrics_controller(self) -> Response:
+        return text(self.render())
+
+    def reset(self) -> None:
+        self.stages_histograms.clear()
+
+
+def escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"')
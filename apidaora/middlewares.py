@@ -1,29 +1,48 @@
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from http import HTTPStatus
 from logging import Logger, getLogger
-from typing import Any, Callable, Iterable, List, Optional, Union
-
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .asgi.base import ASGIHeaders, ASGIResponse
+from .asgi.responses import HTTP_RESPONSE_START
+from .cache import LRUCache
 from .header import Header
 from .request import Request
 from .responses import Response
 
 
+PreExecutionMiddleware = Callable[
+    [Request], Union[None, Response, Awaitable[Optional[Response]]]
+]
+PostExecutionMiddleware = Callable[
+    [Request, Response], Union[None, Awaitable[None]]
+]
+
+
 @dataclass(init=False)
 class Middlewares:
-    pre_execution: List[Callable[[Request], None]]
-    post_execution: List[Callable[[Request, Response], None]]
+    pre_execution: List[PreExecutionMiddleware]
+    post_execution: List[PostExecutionMiddleware]
 
     def __init__(
         self,
         pre_execution: Optional[
-            Union[List[Callable[[Request], None]], Callable[[Request], None]]
+            Union[List[PreExecutionMiddleware], PreExecutionMiddleware]
         ] = None,
         post_execution: Optional[
-            Union[
-                List[Callable[[Request, Response], None]],
-                Callable[[Request, Response], None],
-            ]
+            Union[List[PostExecutionMiddleware], PostExecutionMiddleware]
         ] = None,
     ):
 
@@ -49,31 +68,141 @@ class Middlewares:
         self.post_execution = post_execution
 
 
+PreflightCache = LRUCache[Tuple[bytes, bytes], ASGIResponse]
+PreExecutionChain = Callable[[Request], Awaitable[Optional[Response]]]
+PostExecutionChain = Callable[[Request, Response], Awaitable[None]]
+
+
+@dataclass
+class MiddlewaresChain:
+    pre_execution: Optional[PreExecutionChain] = None
+    post_execution: Optional[PostExecutionChain] = None
+    headers: Optional[ASGIHeaders] = None
+
+
+def make_middlewares_chain(
+    middlewares: Optional[Middlewares],
+) -> MiddlewaresChain:
+    if not middlewares:
+        return MiddlewaresChain()
+
+    post_execution = []
+    headers: ASGIHeaders = []
+
+    for middleware in middlewares.post_execution:
+        if is_static_headers_middleware(middleware):
+            headers.extend(middleware.asgi_headers)  # type: ignore
+        else:
+            post_execution.append(middleware)
+
+    return MiddlewaresChain(
+        pre_execution=make_pre_execution_chain(middlewares.pre_execution),
+        post_execution=make_post_execution_chain(post_execution),
+        headers=headers or None,
+    )
+
+
+def make_pre_execution_chain(
+    middlewares: List[PreExecutionMiddleware],
+) -> Optional[PreExecutionChain]:
+    if not middlewares:
+        return None
+
+    middlewares_tuple = tuple(middlewares)
+
+    async def pre_execution(request: Request) -> Optional[Response]:
+        for middleware in middlewares_tuple:
+            middleware_output = middleware(request)
+
+            if asyncio.iscoroutine(middleware_output):
+                middleware_output = await middleware_output  # type: ignore
+
+            if isinstance(middleware_output, Response):
+                return middleware_output
+
+        return None
+
+    return pre_execution
+
+
+def make_post_execution_chain(
+    middlewares: List[PostExecutionMiddleware],
+) -> Optional[PostExecutionChain]:
+    if not middlewares:
+        return None
+
+    middlewares_tuple = tuple(middlewares)
+
+    async def post_execution(request: Request, response: Response) -> None:
+        for middleware in middlewares_tuple:
+            middleware_output = middleware(request, response)
+
+            if asyncio.iscoroutine(middleware_output):
+                await middleware_output
+
+    return post_execution
+
+
+def is_static_headers_middleware(middleware: Any) -> bool:
+    return (
+        isinstance(middleware, StaticHeadersMiddleware)
+        and type(middleware).__call__ is StaticHeadersMiddleware.__call__
+    )
+
+
 class AllowOriginHeader(
-    Header, type=str, http_name='access-control-allow-origin'
+    Header,
+    type=str,
+    http_name='access-control-allow-origin',
+    constant=True,
 ):
     ...
 
 
 class ExposeHeadersHeader(
-    Header, type=str, http_name='access-control-expose-headers'
+    Header,
+    type=str,
+    http_name='access-control-expose-headers',
+    constant=True,
 ):
     ...
 
 
 class AllowHeadersHeader(
-    Header, type=str, http_name='access-control-allow-headers'
+    Header,
+    type=str,
+    http_name='access-control-allow-headers',
+    constant=True,
 ):
     ...
 
 
 class AllowMethodsHeader(
-    Header, type=str, http_name='access-control-allow-methods'
+    Header,
+    type=str,
+    http_name='access-control-allow-methods',
+    constant=True,
 ):
     ...
 
 
-class CorsMiddleware:
+class StaticHeadersMiddleware:
+    headers: List[Header]
+    headers_tuple: Tuple[Header, ...]
+    asgi_headers: ASGIHeaders
+
+    def __call__(self, request: Request, response: Response) -> None:
+        if isinstance(response.headers, list):
+            response.headers.extend(self.headers)
+
+        elif isinstance(response.headers, tuple):
+            response.headers = response.headers + self.headers_tuple
+
+        elif response.headers is None:
+            response.headers = self.headers_tuple
+
+
+class CorsMiddleware(StaticHeadersMiddleware):
     def __init__(
         self,
         *,
@@ -83,6 +212,7 @@ class CorsMiddleware:
         allow_methods: Optional[str] = None,
         servers_all: Optional[str] = '*',
         logger: Logger = getLogger(__name__),
+        preflight_cache: Optional[PreflightCache] = None,
     ):
         if (
             not allow_origin
@@ -108,17 +238,45 @@ class CorsMiddleware:
                 self.headers.append(AllowMethodsHeader(allow_methods))
 
         self.headers_tuple = tuple(self.headers)
+        self.asgi_headers = [header.encode() for header in self.headers]
+        self.allowed_origins = parse_allowed_values(allow_origin)
+        self.allowed_methods = parse_allowed_values(allow_methods)
+        self.preflight_cache: PreflightCache = (
+            LRUCache() if preflight_cache is None else preflight_cache
+        )
         self.logger = logger
 
-    def __call__(self, request: Request, response: Response) -> None:
-        if isinstance(response.headers, list):
-            response.headers.extend(self.headers)
+    def get_preflight_response(
+        self, origin: bytes, method: bytes
+    ) -> ASGIResponse:
+        key = (origin, method)
+        response = self.preflight_cache.get(key)
 
-        elif isinstance(response.headers, tuple):
-            response.headers = response.headers + self.headers_tuple
+        if response is None:
+            response = self.make_preflight_response(origin, method)
+            self.preflight_cache.set(key, response)
 
-        elif response.headers is None:
-            response.headers = self.headers_tuple
+        return response
+
+    def make_preflight_response(
+        self, origin: bytes, method: bytes
+    ) -> ASGIResponse:
+        allowed = (
+            self.allowed_origins is None or origin in self.allowed_origins
+        ) and (self.allowed_methods is None or method in self.allowed_methods)
+
+        return {
+            'type': HTTP_RESPONSE_START,
+            'status': HTTPStatus.NO_CONTENT.value,
+            'headers': self.asgi_headers if allowed else [],
+        }
+
+
+def parse_allowed_values(values: Optional[str]) -> Optional[Set[bytes]]:
+    if not values or values.strip() == '*':
+        return None
+
+    return {value.strip().encode() for value in values.split(',')}
 
 
 @dataclass(init=False)
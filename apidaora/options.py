@@ -5,16 +5,16 @@ from .method import MethodType
 from .responses import Response, no_content
 
 
-class AllowHeader(Header, type=str, http_name='allow'):
+class AllowHeader(Header, type=str, http_name='allow', constant=True):
     ...
 
 
 def make_options_controller(
     methods: List[MethodType],
 ) -> Callable[[], Response]:
+    allow_header = AllowHeader(','.join([m.value for m in methods]))
+
     def controller() -> Response:
-        return no_content(
-            headers=[AllowHeader(','.join([m.value for m in methods]))]
-        )
+        return no_content(headers=[allow_header])
 
     return controller
@@ -0,0 +1,29 @@
+from typing import Any, Callable, Generic, List, TypeVar
+
+
+PooledObject = TypeVar('PooledObject')
+
+
+class ObjectPool(Generic[PooledObject]):
+    def __init__(
+        self, factory: Callable[..., PooledObject], maxsize: int = 0
+    ):
+        self.factory = factory
+        self.maxsize = maxsize
+        self.objects: List[PooledObject] = []
+
+    def acquire(self, *args: Any, **kwargs: Any) -> PooledObject:
+        if self.objects:
+            pooled_object = self.objects.pop()
+            pooled_object.__init__(*args, **kwargs)  # type: ignore
+            return pooled_object
+
+        return self.factory(*args, **kwargs)
+
+    def release(self, pooled_object: PooledObject) -> None:
+        if len(self.objects) < self.maxsize:
+            pooled_object.reset()  # type: ignore
+            self.objects.append(pooled_object)
+
+    def __len__(self) -> int:
+        return len(self.objects)
@@ -1,10 +1,27 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Type
+from typing import Any, Callable, Dict, Optional, Type
 
 from .header import Header
 from .route.controller_input import ControllerInput
 
 
+class LazyBody:
+    def __get__(self, request: Any, owner: Any) -> Any:
+        if request is None:
+            return None
+
+        parse_body = request.__dict__.pop('parse_body', None)
+
+        if parse_body is not None:
+            request.__dict__['parsed_body'] = parse_body()
+
+        return request.__dict__.get('parsed_body')
+
+    def __set__(self, request: Any, body: Any) -> None:
+        request.__dict__.pop('parse_body', None)
+        request.__dict__['parsed_body'] = body
+
+
 @dataclass
 class Request:
     path_pattern: str
@@ -13,9 +30,15 @@ class Request:
     path_args: Optional[Dict[str, Any]] = None
     query_dict: Optional[Dict[str, Any]] = None
     headers: Optional[Dict[str, Header]] = None
-    body: Any = None
+    body: Any = LazyBody()
     ctx: Dict[str, Any] = field(default_factory=dict)
 
+    def set_body_parser(self, parse_body: Callable[[], Any]) -> None:
+        self.__dict__['parse_body'] = parse_body
+
+    def reset(self) -> None:
+        self.__dict__.clear()
+
 
 def make_controller_input_from_request(request: Request) -> ControllerInput:
     kwargs = {}
@@ -33,3 +56,52 @@ def make_controller_input_from_request(request: Request) -> ControllerInput:
         kwargs['request'] = request
 
     return request.controller_input_cls(**kwargs)
+
+
+def make_controller_kwargs_getter(
+    controller_input_cls: Type[ControllerInput],
+) -> Callable[[Request], Dict[str, Any]]:
+    annotations_info = controller_input_cls.__annotations_info__
+    sources = tuple(
+        source
+        for source, has_source in (
+            ('path_args', annotations_info.has_path_args),
+            ('query_dict', annotations_info.has_query_dict),
+            ('headers', annotations_info.has_headers),
+        )
+        if has_source
+    )
+    has_body = annotations_info.has_body
+    has_kwargs = annotations_info.has_kwargs
+
+    if len(sources) == 1 and not has_body and not has_kwargs:
+        source = sources[0]
+
+        def get_source_kwargs(request: Request) -> Dict[str, Any]:
+            kwargs: Optional[Dict[str, Any]] = getattr(request, source)
+            return kwargs or {}
+
+        return get_source_kwargs
+
+    def get_kwargs(request: Request) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {}
+
+        for source in sources:
+            source_kwargs = getattr(request, source)
+
+            if source_kwargs:
+                kwargs.update(source_kwargs)
+
+        if has_body:
+            body = request.body
+
+            if body:
+                kwargs['body'] = body
+
+        if has_kwargs:
+            kwargs.update(request.ctx)
+            kwargs['request'] = request
+
+        return kwargs
+
+    return get_kwargs
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterable, Iterable
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Sequence
 
@@ -122,3 +123,61 @@ def javascript(
         content_type=ContentType.TEXT_JAVASCRIPT,
         ctx=kwargs,
     )
+
+
+def stream(
+    body: Any,
+    status: HTTPStatus = HTTPStatus.OK,
+    headers: Sequence[Header] = (),
+    content_type: ContentType = ContentType.TEXT_PLAIN,
+    **kwargs: Any,
+) -> Response:
+    return Response(
+        body=body,
+        status=status,
+        headers=headers,
+        content_type=content_type,
+        ctx=kwargs,
+    )
+
+
+def json_stream(
+    body: Any,
+    status: HTTPStatus = HTTPStatus.OK,
+    headers: Sequence[Header] = (),
+    **kwargs: Any,
+) -> Response:
+    return Response(
+        body=make_items_iterator(body),
+        status=status,
+        headers=headers,
+        content_type=ContentType.APPLICATION_JSON,
+        ctx=kwargs,
+    )
+
+
+def ndjson(
+    body: Any,
+    status: HTTPStatus = HTTPStatus.OK,
+    headers: Sequence[Header] = (),
+    **kwargs: Any,
+) -> Response:
+    return Response(
+        body=make_items_iterator(body),
+        status=status,
+        headers=headers,
+        content_type=ContentType.APPLICATION_NDJSON,
+        ctx=kwargs,
+    )
+
+
+def make_items_iterator(body: Any) -> Any:
+    if isinstance(body, AsyncIterable):
+        return body.__aiter__()
+
+    if isinstance(body, Iterable) and not isinstance(
+        body, (str, bytes, dict)
+    ):
+        return iter(body)
+
+    return body
@@ -9,7 +9,7 @@ def get_annotations_path_args(
     return {
         name: type_
         for name, type_ in annotations.items()
-        if f'{{{name}}}' in path_pattern
+        if f'{{{name}}}' in path_pattern or f'{{{name}:' in path_pattern
     }
 
 
@@ -44,7 +44,7 @@ def get_annotations_headers(
                     else 'x-'
                 )
                 http_name += name.replace('_', '-')
-                type_.http_name = http_name
+                type_.set_http_name(http_name)
             else:
                 http_name = type_.http_name
 
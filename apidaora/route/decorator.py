@@ -36,10 +36,18 @@ class _RouteDecorator:
             if len(kwargs) > 0 and not any(
                 (
                     'tasks_repository_uri' in keys,
+                    'tasks_repository_pool_minsize' in keys,
+                    'tasks_repository_pool_maxsize' in keys,
                     'lock' in keys,
                     'lock_args' in keys,
+                    'lock_ttl' in keys,
+                    'result_ttl' in keys,
+                    'executor' in keys,
                     'middlewares' in keys,
                     'options' in keys,
+                    'max_body_size' in keys,
+                    'direct_call' in keys,
+                    'query_cache' in keys,
                 )
             ):
                 raise InvalidRouteArgumentsError(kwargs)
@@ -49,11 +57,25 @@ class _RouteDecorator:
             ) -> Union[Controller, BackgroundTask]:
                 middlewares = kwargs.get('middlewares')
                 options = kwargs.get('options')
+                max_body_size = kwargs.get('max_body_size')
+                direct_call = kwargs.get('direct_call', False)
+                query_cache = kwargs.get('query_cache')
 
                 if brackground:
                     tasks_repository_uri = kwargs.get('tasks_repository_uri')
                     lock = kwargs.get('lock')
                     lock_args = kwargs.get('lock_args')
+                    background_options = {
+                        key: kwargs[key]
+                        for key in (
+                            'tasks_repository_pool_minsize',
+                            'tasks_repository_pool_maxsize',
+                            'lock_ttl',
+                            'result_ttl',
+                            'executor',
+                        )
+                        if key in kwargs
+                    }
                     return make_background_task(
                         controller,
                         path_pattern,
@@ -62,6 +84,9 @@ class _RouteDecorator:
                         lock_args=lock_args,  # type: ignore
                         middlewares=middlewares,
                         options=options,  # type: ignore
+                        max_body_size=max_body_size,
+                        query_cache=query_cache,
+                        **background_options,
                     )
 
                 else:
@@ -71,6 +96,9 @@ class _RouteDecorator:
                         controller,
                         route_middlewares=middlewares,
                         options=options,  # type: ignore
+                        max_body_size=max_body_size,
+                        direct_call=direct_call,
+                        query_cache=query_cache,
                     )
                     return route.controller
 
@@ -1,34 +1,24 @@
 import functools
-import itertools
-from asyncio import iscoroutine
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import is_dataclass
 from http import HTTPStatus
-from json import JSONDecodeError
-from typing import (  # type: ignore
-    Any,
-    Awaitable,
-    Callable,
-    Dict,
-    List,
-    Optional,
-    Sequence,
-    Type,
-    Union,
-    _GenericAlias,
-)
+from inspect import iscoroutine
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Union
 
 import orjson
 from jsondaora import dataclass_asjson, typed_dict_asjson
-from jsondaora.deserializers import deserialize_field
 from jsondaora.exceptions import DeserializationError
 
 from ..asgi.base import ASGICallableResults, ASGIHeaders, ASGIResponse
+from ..asgi.query import QueryCache, make_query_parser
 from ..asgi.request import AsgiRequest
 from ..asgi.responses import (
     make_css_response,
     make_html_response,
     make_javascript_response,
     make_json_response,
+    make_ndjson_response,
     make_no_content_response,
     make_not_found_response,
     make_see_other_response,
@@ -36,15 +26,40 @@ from ..asgi.responses import (
     make_yaml_response,
 )
 from ..asgi.router import Controller, Route
-from ..bodies import GZipFactory
 from ..content import ContentType
 from ..exceptions import BadRequestError, InvalidReturnError
 from ..header import Header
+from ..instrumentation import (
+    CONTROLLER,
+    MIDDLEWARES,
+    OUTPUT,
+    PARSE,
+    Instrumentation,
+)
 from ..method import MethodType
-from ..middlewares import Middlewares
-from ..request import Request, make_controller_input_from_request
+from ..middlewares import (
+    Middlewares,
+    PostExecutionChain,
+    PreExecutionChain,
+    make_middlewares_chain,
+)
+from ..request import (
+    Request,
+    make_controller_input_from_request,
+    make_controller_kwargs_getter,
+)
 from ..responses import Response
 from .controller_input import controller_input
+from .output_serializer import (
+    OutputSerializer,
+    make_output_serializer,
+    make_stream_chunks,
+)
+from .request_parser import (
+    is_body_stream_type,
+    is_gzip_factory_type,
+    make_request_parser,
+)
 
 
 RESPONSES_MAP: Dict[
@@ -56,6 +71,7 @@ RESPONSES_MAP: Dict[
     ContentType.TEXT_CSS: make_css_response,
     ContentType.TEXT_JAVASCRIPT: make_javascript_response,
     ContentType.APPLICATION_YAML: make_yaml_response,
+    ContentType.APPLICATION_NDJSON: make_ndjson_response,
     HTTPStatus.NOT_FOUND: make_not_found_response,
     HTTPStatus.NO_CONTENT: make_no_content_response,
     HTTPStatus.SEE_OTHER: make_see_other_response,
@@ -69,77 +85,19 @@ def make_route(
     has_content_length: bool = True,
     route_middlewares: Optional[Union[Middlewares]] = None,
     options: bool = False,
+    max_body_size: Optional[int] = None,
+    direct_call: bool = False,
+    query_cache: Optional[QueryCache] = None,
 ) -> Route:
     ControllerInput = controller_input(controller, path_pattern)
     annotations_info = ControllerInput.__annotations_info__
-    annotations_path_args = ControllerInput.__annotations_path_args__
-    annotations_query_dict = ControllerInput.__annotations_query_dict__
-    annotations_headers = ControllerInput.__annotations_headers__
-    body_type = ControllerInput.__annotations_body__.get('body')
     return_type = controller.__annotations__.get('return')
-
-    def parse_asgi_input(
-        asgi_request: AsgiRequest, middlewares: Optional[Middlewares] = None,
-    ) -> Request:
-        request = Request(
-            asgi_request.path_pattern,
-            asgi_request.resolved_path,
-            ControllerInput,
-        )
-
-        if annotations_info.has_input:
-            if annotations_info.has_path_args:
-                request.path_args = {
-                    name: deserialize_field(
-                        name, type_, asgi_request.path_args.get(name)
-                    )
-                    for name, type_ in annotations_path_args.items()
-                }
-
-            if annotations_info.has_query_dict:
-                request.query_dict = {
-                    name: deserialize_field(
-                        name,
-                        type_,
-                        parse_query_args(
-                            name, type_, asgi_request.query_dict.get(name)
-                        ),
-                    )
-                    for name, type_ in annotations_query_dict.items()
-                    if name != 'body'
-                }
-
-            if annotations_info.has_headers:
-                headers_map = ControllerInput.__headers_name_map__
-                request.headers = {
-                    name: annotations_headers[name](h_value.decode())  # type: ignore
-                    for h_name, h_value in asgi_request.headers
-                    if (name := headers_map.get(h_name.decode()))  # noqa
-                    in annotations_headers
-                }
-
-            if annotations_info.has_body:
-                if isinstance(body_type, type) and issubclass(
-                    body_type, GZipFactory
-                ):
-                    request.body = body_type(value=asgi_request.body)
-
-                elif isinstance(body_type, type) and issubclass(
-                    body_type, str
-                ):
-                    request.body = asgi_request.body.decode()
-
-                else:
-                    request.body = make_json_request_body(
-                        asgi_request.body, body_type
-                    )
-                    request.body = (
-                        deserialize_field('body', body_type, request.body)
-                        if request.body
-                        else None
-                    )
-
-        return request
+    parse_asgi_input = make_request_parser(ControllerInput)
+    get_controller_kwargs = (
+        make_controller_kwargs_getter(ControllerInput)
+        if direct_call
+        else make_controller_input_from_request
+    )
 
     async def build_asgi_output(
         request: Request,
@@ -148,7 +106,8 @@ def make_route(
         headers: Optional[Sequence[Header]] = None,
         content_type: Optional[ContentType] = ContentType.APPLICATION_JSON,
         return_type_: Any = None,
-        middlewares: Optional[Middlewares] = None,
+        post_execution: Optional[PostExecutionChain] = None,
+        static_headers: Optional[ASGIHeaders] = None,
     ) -> ASGICallableResults:
         while iscoroutine(controller_output):
             controller_output = await controller_output
@@ -156,7 +115,7 @@ def make_route(
         if return_type_ is None and return_type:
             return_type_ = return_type
 
-        if middlewares:
+        if post_execution:
             if not isinstance(controller_output, Response):
                 controller_output = Response(
                     body=controller_output,
@@ -165,8 +124,7 @@ def make_route(
                     content_type=content_type,
                 )
 
-            for middleware in middlewares.post_execution:
-                middleware(request, controller_output)
+            await post_execution(request, controller_output)
 
         if isinstance(controller_output, Response):
             return build_asgi_output(
@@ -176,6 +134,21 @@ def make_route(
                 controller_output['headers'],
                 controller_output['content_type'],
                 controller_output.__annotations__.get('body'),
+                static_headers=static_headers,
+            )
+
+        elif isinstance(controller_output, (Iterator, AsyncIterator)) or (
+            content_type == ContentType.APPLICATION_NDJSON
+            and isinstance(controller_output, (list, tuple))
+        ):
+            if isinstance(controller_output, (list, tuple)):
+                controller_output = iter(controller_output)
+
+            return (
+                RESPONSES_MAP[content_type](  # type: ignore
+                    None, status, make_asgi_headers(headers, static_headers)
+                ),
+                make_stream_chunks(controller_output, content_type),
             )
 
         elif isinstance(controller_output, dict):
@@ -210,14 +183,19 @@ def make_route(
             content_length = 0 if has_content_length else None
 
             if content_type is None and status in RESPONSES_MAP:
-                if headers:
-                    return (RESPONSES_MAP[status](make_asgi_headers(headers)),)
+                if headers or static_headers:
+                    return (
+                        RESPONSES_MAP[status](
+                            make_asgi_headers(headers, static_headers)
+                        ),
+                    )
 
                 return (RESPONSES_MAP[status](headers),)
 
-            if headers:
+            if headers or static_headers:
                 return RESPONSES_MAP[content_type](  # type: ignore
-                    content_length, headers=make_asgi_headers(headers)
+                    content_length,
+                    headers=make_asgi_headers(headers, static_headers),
                 )
 
             return RESPONSES_MAP[content_type](content_length)  # type: ignore
@@ -229,29 +207,106 @@ def make_route(
 
         return (
             RESPONSES_MAP[content_type](  # type: ignore
-                content_length, status, make_asgi_headers(headers)
+                content_length,
+                status,
+                make_asgi_headers(headers, static_headers),
             ),
             body,
         )
 
     class WrappedController(Controller):
+        pre_execution: Optional[PreExecutionChain] = None
+        post_execution: Optional[PostExecutionChain] = None
+        static_headers: Optional[ASGIHeaders] = None
+        serialize_output: Optional[OutputSerializer] = None
+        middlewares_: Optional[Middlewares] = None
+        instrumentation: Optional[Instrumentation] = None
+
+        @property
+        def middlewares(self) -> Optional[Middlewares]:
+            return self.middlewares_
+
+        @middlewares.setter
+        def middlewares(self, middlewares: Optional[Middlewares]) -> None:
+            chain = make_middlewares_chain(middlewares)
+            self.middlewares_ = middlewares
+            self.pre_execution = chain.pre_execution
+            self.post_execution = chain.post_execution
+            self.static_headers = chain.headers
+            self.serialize_output = (
+                None
+                if chain.post_execution
+                else make_output_serializer(
+                    return_type, has_content_length, self.static_headers
+                )
+            )
+
         @functools.wraps(controller)
         async def __call__(
             self, asgi_request: AsgiRequest,
         ) -> Union[Awaitable[ASGICallableResults], ASGICallableResults]:
+            instrumentation = self.instrumentation
+
+            if instrumentation:
+                stage_started_at = perf_counter()
+
             try:
-                request = parse_asgi_input(asgi_request,)
-                if self.middlewares:
-                    for middleware in self.middlewares.pre_execution:
-                        middleware(request)
+                if self.pre_execution:
+                    request = parse_asgi_input(asgi_request, True)
+
+                    if instrumentation:
+                        stage_started_at = record_stage(
+                            instrumentation, PARSE, stage_started_at
+                        )
+
+                    response = await self.pre_execution(request)
+
+                    if instrumentation:
+                        stage_started_at = record_stage(
+                            instrumentation, MIDDLEWARES, stage_started_at
+                        )
+
+                    if response is not None:
+                        asgi_output = await build_asgi_output(
+                            request,
+                            response,
+                            post_execution=self.post_execution,
+                            static_headers=self.static_headers,
+                        )
+
+                        if instrumentation:
+                            record_stage(
+                                instrumentation, OUTPUT, stage_started_at
+                            )
+
+                        return asgi_output
+
+                else:
+                    request = parse_asgi_input(asgi_request, False)
+
+                    if instrumentation:
+                        stage_started_at = record_stage(
+                            instrumentation, PARSE, stage_started_at
+                        )
 
                 controller_output = controller(
-                    **make_controller_input_from_request(request)
+                    **get_controller_kwargs(request)
                 )
 
-                return await build_asgi_output(
-                    request, controller_output, middlewares=self.middlewares,
-                )
+                if instrumentation:
+                    while iscoroutine(controller_output):
+                        controller_output = await controller_output
+
+                    stage_started_at = record_stage(
+                        instrumentation, CONTROLLER, stage_started_at
+                    )
+                    asgi_output = await self.build_output(
+                        request, controller_output
+                    )
+                    record_stage(instrumentation, OUTPUT, stage_started_at)
+                    return asgi_output
+
+                return await self.build_output(request, controller_output)
 
             except BadRequestError as error:
                 if self.logger:
@@ -273,6 +328,34 @@ def make_route(
                     error_dict, has_content_length
                 )
 
+        async def build_output(
+            self, request: Request, controller_output: Any
+        ) -> ASGICallableResults:
+            if self.serialize_output:
+                while iscoroutine(controller_output):
+                    controller_output = await controller_output
+
+                asgi_output = self.serialize_output(controller_output)
+
+                if asgi_output is not None:
+                    return asgi_output
+
+            return await build_asgi_output(
+                request,
+                controller_output,
+                post_execution=self.post_execution,
+                static_headers=self.static_headers,
+            )
+
+    def record_stage(
+        instrumentation: Instrumentation, stage: str, stage_started_at: float
+    ) -> float:
+        stage_finished_at = perf_counter()
+        instrumentation.record(
+            path_pattern, stage, stage_finished_at - stage_started_at
+        )
+        return stage_finished_at
+
     wrapped_controller = WrappedController()
     route = Route(
         path_pattern,
@@ -283,6 +366,16 @@ def make_route(
         annotations_info.has_headers,
         annotations_info.has_body,
         has_options=options,
+        has_body_stream=annotations_info.has_body
+        and is_body_stream_type(ControllerInput.__annotations_body__['body']),
+        has_raw_body=annotations_info.has_body
+        and is_gzip_factory_type(ControllerInput.__annotations_body__['body']),
+        max_body_size=max_body_size,
+        query_parser=make_query_parser(
+            ControllerInput.__annotations_query_dict__, query_cache
+        )
+        if annotations_info.has_query_dict
+        else None,
     )
     routes = [route]
 
@@ -295,17 +388,6 @@ def make_route(
     return route
 
 
-def make_json_request_body(body: bytes, body_type: Optional[Type[Any]]) -> Any:
-    try:
-        return orjson.loads(body)
-    except JSONDecodeError:
-        schema = (
-            getattr(body_type, '__annotations__', {}) if body_type else None
-        )
-        schema = {k: t.__name__ for k, t in schema.items()}
-        raise BadRequestError(name='invalid-body', info={'schema': schema})
-
-
 def send_bad_request_response(
     error_dict: Dict[str, Any],
     has_content_length: bool,
@@ -325,39 +407,14 @@ def send_bad_request_response(
 
 def make_asgi_headers(
     headers: Optional[Sequence[Header]],
+    static_headers: Optional[ASGIHeaders] = None,
 ) -> Optional[ASGIHeaders]:
     if not headers:
-        return None
-
-    return [
-        (
-            header.http_name.encode(),  # type: ignore
-            str(header.value).encode()
-            if not isinstance(header.value, bytes)
-            else header.value,
-        )
-        for header in headers
-    ]
-
-
-def parse_query_args(
-    name: str, type_: Type[Any], value: Optional[List[str]]
-) -> Any:
-    if value is not None:
-        if isinstance(type_, _GenericAlias) and type_._name in (
-            'List',
-            'Tuple',
-            'Set',
-            'Deque',
-        ):
-            value = list(itertools.chain(*[v.split(',') for v in value]))
+        return static_headers
 
-        elif len(value) > 1:
-            raise BadRequestError(
-                name='invalid-query',
-                info={'name': name, 'type': type_, 'value': value},
-            )
-        else:
-            value = value[0]  # type: ignore
+    asgi_headers = [header.encode() for header in headers]
+
+    if static_headers:
+        asgi_headers.extend(static_headers)
 
-        return value
+    return asgi_headers
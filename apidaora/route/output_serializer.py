@@ -0,0 +1,239 @@
+import dataclasses
+import functools
+from collections.abc import AsyncIterator as AsyncIteratorABC
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Union
+
+import orjson
+from jsondaora import dataclass_asjson, typed_dict_asjson
+from jsondaora.fields import SerializeFields
+from jsondaora.serializers import OrjsonDefaultTypes
+
+from ..asgi.base import ASGICallableResults, ASGIHeaders, ASGIResponse
+from ..asgi.responses import (
+    HTTP_RESPONSE_START,
+    JSON_CONTENT_HEADER,
+    JSON_RESPONSE,
+    make_chunks_iterator,
+)
+from ..content import ContentType
+from ..responses import Response
+
+
+OutputSerializer = Callable[[Any], Optional[ASGICallableResults]]
+StreamItems = Union[Iterator[Any], AsyncIterator[Any]]
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def make_output_serializer(
+    return_type: Any,
+    has_content_length: bool,
+    headers: Optional[ASGIHeaders] = None,
+) -> Optional[OutputSerializer]:
+    return_origin = getattr(return_type, '__origin__', None)
+
+    if return_origin is list or return_origin is tuple:
+        return make_sequence_serializer(
+            return_origin, has_content_length, headers
+        )
+
+    if return_origin is dict:
+        return make_dict_serializer(dict, has_content_length, headers)
+
+    if not isinstance(return_type, type) or issubclass(return_type, Response):
+        return None
+
+    if dataclasses.is_dataclass(return_type):
+        return make_dataclass_serializer(
+            return_type, has_content_length, headers
+        )
+
+    if issubclass(return_type, dict):
+        return make_dict_serializer(return_type, has_content_length, headers)
+
+    if return_type is list or return_type is tuple:
+        return make_sequence_serializer(
+            return_type, has_content_length, headers
+        )
+
+    if return_type in (str, int, float, bool):
+        return make_scalar_serializer(return_type, has_content_length, headers)
+
+    return None
+
+
+def make_dataclass_serializer(
+    return_type: Any,
+    has_content_length: bool,
+    headers: Optional[ASGIHeaders] = None,
+) -> OutputSerializer:
+    make_output = make_json_output_factory(has_content_length, headers)
+
+    if SerializeFields.get_fields(return_type):
+
+        def serialize_fields(controller_output: Any) -> Any:
+            if type(controller_output) is return_type:
+                return make_output(dataclass_asjson(controller_output))
+
+            return None
+
+        return serialize_fields
+
+    default = OrjsonDefaultTypes.default_function
+
+    def serialize(controller_output: Any) -> Any:
+        if type(controller_output) is return_type:
+            return make_output(
+                orjson.dumps(controller_output, default=default)
+            )
+
+        return None
+
+    return serialize
+
+
+def make_dict_serializer(
+    return_type: Any,
+    has_content_length: bool,
+    headers: Optional[ASGIHeaders] = None,
+) -> OutputSerializer:
+    make_output = make_json_output_factory(has_content_length, headers)
+
+    def serialize(controller_output: Any) -> Any:
+        if isinstance(controller_output, dict) and not isinstance(
+            controller_output, Response
+        ):
+            return make_output(
+                typed_dict_asjson(controller_output, return_type)
+            )
+
+        return None
+
+    return serialize
+
+
+def make_sequence_serializer(
+    return_type: Any,
+    has_content_length: bool,
+    headers: Optional[ASGIHeaders] = None,
+) -> OutputSerializer:
+    make_output = make_json_output_factory(has_content_length, headers)
+
+    def serialize(controller_output: Any) -> Any:
+        if isinstance(controller_output, return_type):
+            return make_output(dataclass_asjson(controller_output))
+
+        return None
+
+    return serialize
+
+
+def make_scalar_serializer(
+    return_type: Any,
+    has_content_length: bool,
+    headers: Optional[ASGIHeaders] = None,
+) -> OutputSerializer:
+    make_output = make_json_output_factory(has_content_length, headers)
+
+    def serialize(controller_output: Any) -> Any:
+        if type(controller_output) is return_type:
+            return make_output(orjson.dumps(controller_output))
+
+        return None
+
+    return serialize
+
+
+def make_json_output_factory(
+    has_content_length: bool, headers: Optional[ASGIHeaders] = None,
+) -> Callable[[bytes], ASGICallableResults]:
+    if not has_content_length:
+        if not headers:
+            return lambda body: (JSON_RESPONSE, body)
+
+        response: ASGIResponse = {
+            'type': HTTP_RESPONSE_START,
+            'status': HTTPStatus.OK.value,
+            'headers': [JSON_CONTENT_HEADER, *headers],
+        }
+        return lambda body: (response, body)
+
+    extra_headers = headers or []
+
+    def make_output(body: bytes) -> ASGICallableResults:
+        response: ASGIResponse = {
+            'type': HTTP_RESPONSE_START,
+            'status': HTTPStatus.OK.value,
+            'headers': [
+                JSON_CONTENT_HEADER,
+                (b'content-length', str(len(body)).encode()),
+                *extra_headers,
+            ],
+        }
+        return response, body
+
+    return make_output
+
+
+def make_stream_chunks(
+    items: StreamItems, content_type: Optional[ContentType]
+) -> AsyncIterator[bytes]:
+    if content_type == ContentType.APPLICATION_JSON:
+        return make_serialized_chunks(items, b'[', b',', b']')
+
+    if content_type == ContentType.APPLICATION_NDJSON:
+        return make_serialized_chunks(items, b'', b'\n', b'\n')
+
+    return make_chunks_iterator(items)
+
+
+async def make_serialized_chunks(
+    items: StreamItems, start: bytes, separator: bytes, end: bytes,
+) -> AsyncIterator[bytes]:
+    buffer = [start]
+    size = len(start)
+    item_separator = b''
+
+    async for item in iterate_items(items):
+        item_json = serialize_item(item)
+        buffer.append(item_separator)
+        buffer.append(item_json)
+        item_separator = separator
+        size += len(separator) + len(item_json)
+
+        if size >= STREAM_CHUNK_SIZE:
+            yield b''.join(buffer)
+            buffer = []
+            size = 0
+
+    if start or item_separator:
+        buffer.append(end)
+
+    yield b''.join(buffer)
+
+
+async def iterate_items(items: StreamItems) -> AsyncIterator[Any]:
+    if isinstance(items, AsyncIteratorABC):
+        async for item in items:
+            yield item
+
+    else:
+        for item in items:
+            yield item
+
+
+def serialize_item(item: Any) -> bytes:
+    if isinstance(item, bytes):
+        return item
+
+    if dataclasses.is_dataclass(item) and has_serialize_fields(
+        type(item)  # type: ignore
+    ):
+        return dataclass_asjson(item)
+
+    return orjson.dumps(item, default=OrjsonDefaultTypes.default_function)
+
+
+@functools.lru_cache(maxsize=None)
+def has_serialize_fields(cls: Any) -> bool:
+    return bool(SerializeFields.get_fields(cls))
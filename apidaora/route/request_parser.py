@@ -0,0 +1,294 @@
+import dataclasses
+import functools
+from json import JSONDecodeError
+from typing import (  # type: ignore
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    _GenericAlias,
+)
+
+import orjson
+from jsondaora.deserializers import deserialize_field
+from jsondaora.exceptions import DeserializationError
+
+from ..asgi.request import AsgiRequest
+from ..bodies import BodyStream, GZipFactory
+from ..exceptions import BadRequestError
+from ..header import Header
+from ..request import Request
+from .controller_input import ControllerInput
+
+
+TRUE_VALUES = (b'1', 1, '1', 't', 'true', 'y', 'yes')
+SEQUENCE_GENERICS_NAMES = ('List', 'Tuple', 'Set', 'Deque')
+
+FieldDeserializer = Callable[[Any], Any]
+RequestParser = Callable[[AsgiRequest, bool], Request]
+
+
+def make_request_parser(
+    controller_input_cls: Type[ControllerInput],
+) -> RequestParser:
+    annotations_info = controller_input_cls.__annotations_info__
+    parsers: List[Tuple[str, Callable[[AsgiRequest], Any]]] = []
+    parse_body: Optional[Callable[[AsgiRequest], Any]] = None
+
+    if annotations_info.has_path_args:
+        parsers.append(
+            (
+                'path_args',
+                make_path_args_parser(
+                    controller_input_cls.__annotations_path_args__
+                ),
+            )
+        )
+
+    if annotations_info.has_query_dict:
+        parsers.append(
+            (
+                'query_dict',
+                make_query_dict_parser(
+                    controller_input_cls.__annotations_query_dict__
+                ),
+            )
+        )
+
+    if annotations_info.has_headers:
+        parsers.append(
+            (
+                'headers',
+                make_headers_parser(
+                    controller_input_cls.__headers_name_map__,
+                    controller_input_cls.__annotations_headers__,
+                ),
+            )
+        )
+
+    if annotations_info.has_body:
+        parse_body = make_body_parser(
+            controller_input_cls.__annotations_body__['body']
+        )
+
+    def parse_asgi_input(
+        asgi_request: AsgiRequest, lazy_body: bool = False
+    ) -> Request:
+        if asgi_request.requests_pool is None:
+            request = Request(
+                asgi_request.path_pattern,
+                asgi_request.resolved_path,
+                controller_input_cls,
+            )
+        else:
+            request = asgi_request.requests_pool.acquire(
+                asgi_request.path_pattern,
+                asgi_request.resolved_path,
+                controller_input_cls,
+            )
+            asgi_request.request = request
+
+        for attr_name, parser in parsers:
+            setattr(request, attr_name, parser(asgi_request))
+
+        if parse_body is not None:
+            if lazy_body:
+                request.set_body_parser(
+                    functools.partial(parse_body, asgi_request)
+                )
+            else:
+                request.body = parse_body(asgi_request)
+
+        return request
+
+    return parse_asgi_input
+
+
+def make_field_deserializer(name: str, type_: Any) -> FieldDeserializer:
+    def raise_error(value: Any) -> Any:
+        raise DeserializationError(
+            name, type_, dataclasses.MISSING, value, None
+        )
+
+    if type_ is Any:
+        return lambda value: value
+
+    if type_ is str:
+
+        def deserialize_str(value: Any) -> Any:
+            if isinstance(value, str):
+                return value
+
+            if isinstance(value, bytes):
+                return value.decode()
+
+            if value is None:
+                raise_error(value)
+
+            return str(value)
+
+        return deserialize_str
+
+    if type_ is int or type_ is float:
+
+        def deserialize_number(value: Any) -> Any:
+            if isinstance(value, type_):
+                return value
+
+            try:
+                return type_(value)
+            except (TypeError, ValueError):
+                return raise_error(value)
+
+        return deserialize_number
+
+    if type_ is bool:
+        return lambda value: value is True or value in TRUE_VALUES
+
+    def deserialize_generic(value: Any) -> Any:
+        return deserialize_field(name, type_, value)
+
+    return deserialize_generic
+
+
+def make_path_args_parser(
+    annotations_path_args: Dict[str, Type[Any]]
+) -> Callable[[AsgiRequest], Dict[str, Any]]:
+    deserializers = [
+        (name, make_field_deserializer(name, type_))
+        for name, type_ in annotations_path_args.items()
+    ]
+
+    def parse_path_args(asgi_request: AsgiRequest) -> Dict[str, Any]:
+        path_args = asgi_request.path_args
+        return {
+            name: deserialize(path_args.get(name))
+            for name, deserialize in deserializers
+        }
+
+    return parse_path_args
+
+
+def make_query_dict_parser(
+    annotations_query_dict: Dict[str, Type[Any]]
+) -> Callable[[AsgiRequest], Dict[str, Any]]:
+    deserializers = [
+        (
+            name,
+            type_,
+            is_sequence_type(type_),
+            make_field_deserializer(name, type_),
+        )
+        for name, type_ in annotations_query_dict.items()
+        if name != 'body'
+    ]
+
+    def parse_query_dict(asgi_request: AsgiRequest) -> Dict[str, Any]:
+        query_dict = asgi_request.query_dict
+        parsed = {}
+
+        for name, type_, is_sequence, deserialize in deserializers:
+            value = query_dict.get(name)
+
+            if value is not None:
+                if is_sequence:
+                    value = [item for v in value for item in v.split(',')]
+
+                elif len(value) > 1:
+                    raise BadRequestError(
+                        name='invalid-query',
+                        info={'name': name, 'type': type_, 'value': value},
+                    )
+
+                else:
+                    value = value[0]
+
+            parsed[name] = deserialize(value)
+
+        return parsed
+
+    return parse_query_dict
+
+
+def make_headers_parser(
+    headers_name_map: Dict[str, str],
+    annotations_headers: Dict[str, Type[Any]],
+) -> Callable[[AsgiRequest], Dict[str, Header]]:
+    declared_headers = [
+        (http_name.lower().encode(), name, annotations_headers[name])
+        for http_name, name in headers_name_map.items()
+        if name in annotations_headers
+    ]
+
+    def parse_headers(asgi_request: AsgiRequest) -> Dict[str, Header]:
+        headers = {}
+
+        for h_name, name, header_type in declared_headers:
+            h_value = asgi_request.get_header(h_name)
+
+            if h_value is not None:
+                headers[name] = header_type(h_value.decode())
+
+        return headers
+
+    return parse_headers
+
+
+def make_body_parser(body_type: Any) -> Callable[[AsgiRequest], Any]:
+    if is_body_stream_type(body_type):
+
+        def parse_body_stream(asgi_request: AsgiRequest) -> Any:
+            return asgi_request.body
+
+        return parse_body_stream
+
+    if is_gzip_factory_type(body_type):
+
+        def parse_gzip_body(asgi_request: AsgiRequest) -> Any:
+            return body_type(value=asgi_request.body)
+
+        return parse_gzip_body
+
+    if isinstance(body_type, type) and issubclass(body_type, str):
+
+        def parse_str_body(asgi_request: AsgiRequest) -> Any:
+            return asgi_request.body.decode()  # type: ignore
+
+        return parse_str_body
+
+    def parse_json_body(asgi_request: AsgiRequest) -> Any:
+        body = make_json_request_body(
+            asgi_request.body, body_type  # type: ignore
+        )
+        return deserialize_field('body', body_type, body) if body else None
+
+    return parse_json_body
+
+
+def is_body_stream_type(body_type: Any) -> bool:
+    return isinstance(body_type, type) and issubclass(body_type, BodyStream)
+
+
+def is_gzip_factory_type(body_type: Any) -> bool:
+    return isinstance(body_type, type) and issubclass(body_type, GZipFactory)
+
+
+def is_sequence_type(type_: Type[Any]) -> bool:
+    return (
+        isinstance(type_, _GenericAlias)
+        and type_._name in SEQUENCE_GENERICS_NAMES
+    )
+
+
+def make_json_request_body(body: bytes, body_type: Optional[Type[Any]]) -> Any:
+    try:
+        return orjson.loads(body)
+    except JSONDecodeError:
+        schema = (
+            getattr(body_type, '__annotations__', {}) if body_type else None
+        )
+        schema = {k: t.__name__ for k, t in schema.items()}
+        raise BadRequestError(name='invalid-body', info={'schema': schema})
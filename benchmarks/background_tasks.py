@@ -0,0 +1,116 @@
+import asyncio
+import json
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+from apidaora import appdaora, route
+from apidaora.asgi.base import ASGIApp
+
+
+TASKS = 4
+TASK_LOOPS = 3_000_000
+TICK = 0.005
+
+
+def cpu_bound(loops: int) -> int:
+    total = 0
+
+    for i in range(loops):
+        total += i % 7
+
+    return total
+
+
+@route.background('/thread', executor='thread')
+def thread_task(loops: int) -> int:
+    return cpu_bound(loops)
+
+
+@route.background('/process', executor='process')
+def process_task(loops: int) -> int:
+    return cpu_bound(loops)
+
+
+async def request(
+    app: ASGIApp, method: str, path: str, query_string: bytes
+) -> Any:
+    body = []
+
+    async def receive() -> Dict[str, Any]:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message['type'] == 'http.response.body':
+            body.append(message.get('body', b''))
+
+    await app(
+        {
+            'type': 'http',
+            'method': method,
+            'path': path,
+            'query_string': query_string,
+            'headers': [],
+        },
+        receive,
+        send,
+    )
+    return json.loads(b''.join(body))
+
+
+async def measure(app: ASGIApp, path: str) -> Dict[str, Any]:
+    lags: List[float] = []
+    tasks_ids = [
+        (await request(app, 'POST', path, b'loops=%d' % TASK_LOOPS))[
+            'task_id'
+        ]
+        for _ in range(TASKS)
+    ]
+    start = time.perf_counter()
+
+    while True:
+        tick_start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - tick_start - TICK)
+
+        if len(lags) % 10:
+            continue
+
+        tasks = [
+            await request(app, 'GET', path, b'task_id=' + task_id.encode())
+            for task_id in tasks_ids
+        ]
+
+        if all(task['status'] != 'running' for task in tasks):
+            break
+
+    lags.sort()
+    return {
+        'seconds': time.perf_counter() - start,
+        'loop_lag_p50': statistics.median(lags),
+        'loop_lag_p99': lags[int(len(lags) * 0.99)],
+        'loop_lag_max': lags[-1],
+    }
+
+
+def main() -> None:
+    for name, controller in (
+        ('thread', thread_task),
+        ('process', process_task),
+    ):
+        app = appdaora(controller)
+        json.dump(
+            {
+                'benchmark': 'background_tasks',
+                'executor': name,
+                'tasks': TASKS,
+                **asyncio.run(measure(app, f'/{name}')),
+            },
+            sys.stdout,
+        )
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+from jsondaora import jsondaora
+
+from apidaora import Header, Middlewares, Request, Response, appdaora, route
+from apidaora.asgi.base import ASGIApp
+from apidaora.cache import LRUCache
+
+
+REQUESTS = 2000
+BACKGROUND_TASKS_REQUESTS = 200
+REPEAT = 5
+
+ASGIHeaders = Sequence[Tuple[bytes, bytes]]
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+    price: float
+
+
+@jsondaora
+class ItemBody:
+    id: int
+    name: str
+    price: float
+
+
+class ReqID(Header, type=str, http_name='http_req_id'):
+    ...
+
+
+ITEM = Item(id=1, name='item-1', price=0.01)
+ITEMS = [Item(id=i, name=f'item-{i}', price=i / 100) for i in range(100)]
+
+
+def pre_execution_middleware(request: Request) -> None:
+    request.ctx['started'] = True
+
+
+def post_execution_middleware(request: Request, response: Response) -> None:
+    ...
+
+
+@route.get('/static')
+def static_controller() -> str:
+    return 'Hello!'
+
+
+@route.get('/items/{id}')
+def path_controller(id: int) -> str:
+    return 'Hello!'
+
+
+@route.get('/query')
+def query_controller(name: str, page: int) -> str:
+    return 'Hello!'
+
+
+@route.get('/headers')
+def headers_controller(req_id: ReqID) -> str:
+    return 'Hello!'
+
+
+@route.post('/body')
+def body_controller(body: ItemBody) -> str:
+    return 'Hello!'
+
+
+@route.get('/dict')
+def dict_controller() -> Dict[str, Any]:
+    return {'id': 1, 'name': 'item-1', 'price': 0.01}
+
+
+@route.get('/dataclass')
+def dataclass_controller() -> Item:
+    return ITEM
+
+
+@route.get('/list')
+def list_controller() -> List[Item]:
+    return ITEMS
+
+
+@route.get(
+    '/middlewares',
+    middlewares=Middlewares(
+        pre_execution=pre_execution_middleware,
+        post_execution=post_execution_middleware,
+    ),
+)
+def middlewares_controller() -> str:
+    return 'Hello!'
+
+
+@route.background('/tasks')
+def background_task_controller(name: str) -> str:
+    return f'Hello {name}!'
+
+
+CASES: Dict[str, Tuple[Any, str, str, bytes, ASGIHeaders, bytes]] = {
+    'routing-dict': (static_controller, 'GET', '/static', b'', (), b''),
+    'routing-tree': (
+        [static_controller, path_controller],
+        'GET',
+        '/items/1',
+        b'',
+        (),
+        b'',
+    ),
+    'routing-tree-cached': (
+        [static_controller, path_controller],
+        'GET',
+        '/items/1',
+        b'',
+        (),
+        b'',
+    ),
+    'parse-path': (path_controller, 'GET', '/items/1', b'', (), b''),
+    'parse-query': (
+        query_controller,
+        'GET',
+        '/query',
+        b'name=Me&page=2',
+        (),
+        b'',
+    ),
+    'parse-headers': (
+        headers_controller,
+        'GET',
+        '/headers',
+        b'',
+        ((b'http_req_id', b'1a2b3c4d'),),
+        b'',
+    ),
+    'parse-body': (
+        body_controller,
+        'POST',
+        '/body',
+        b'',
+        ((b'content-type', b'application/json'),),
+        b'{"id":1,"name":"item-1","price":0.01}',
+    ),
+    'serialize-dict': (dict_controller, 'GET', '/dict', b'', (), b''),
+    'serialize-dataclass': (
+        dataclass_controller,
+        'GET',
+        '/dataclass',
+        b'',
+        (),
+        b'',
+    ),
+    'serialize-list': (list_controller, 'GET', '/list', b'', (), b''),
+    'middlewares': (
+        middlewares_controller,
+        'GET',
+        '/middlewares',
+        b'',
+        (),
+        b'',
+    ),
+    'background-task': (
+        background_task_controller,
+        'POST',
+        '/tasks',
+        b'name=Me',
+        (),
+        b'',
+    ),
+}
+APPS_OPTIONS: Dict[str, Dict[str, Any]] = {
+    'routing-tree-cached': {'routes_cache': LRUCache()},
+}
+
+
+def make_scope(
+    method: str, path: str, query_string: bytes, headers: ASGIHeaders
+) -> Dict[str, Any]:
+    return {
+        'type': 'http',
+        'http_version': '1.1',
+        'method': method,
+        'path': path,
+        'query_string': query_string,
+        'headers': list(headers),
+    }
+
+
+async def call(app: ASGIApp, scope: Dict[str, Any], body: bytes) -> int:
+    status = 0
+
+    async def receive() -> Dict[str, Any]:
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+
+        if message['type'] == 'http.response.start':
+            status = message['status']
+
+    await app(scope, receive, send)
+    return status
+
+
+def run(
+    app: ASGIApp, scope: Dict[str, Any], body: bytes, requests: int
+) -> float:
+    async def call_all() -> float:
+        start = time.perf_counter()
+
+        for _ in range(requests):
+            await call(app, scope, body)
+
+        return time.perf_counter() - start
+
+    async def repeat() -> float:
+        status = await call(app, scope, body)
+
+        if status >= 400:
+            raise RuntimeError(f'{scope["path"]} responded {status}')
+
+        return min([await call_all() for _ in range(REPEAT)]) / requests
+
+    return asyncio.run(repeat())
+
+
+def main() -> None:
+    selected = sys.argv[1:]
+
+    for name, (
+        controllers,
+        method,
+        path,
+        query_string,
+        headers,
+        body,
+    ) in CASES.items():
+        if selected and name not in selected:
+            continue
+
+        requests = (
+            BACKGROUND_TASKS_REQUESTS
+            if name == 'background-task'
+            else REQUESTS
+        )
+        json.dump(
+            {
+                'benchmark': 'pipeline',
+                'case': name,
+                'requests': requests,
+                'seconds_per_request': run(
+                    appdaora(controllers, **APPS_OPTIONS.get(name, {})),
+                    make_scope(method, path, query_string, headers),
+                    body,
+                    requests,
+                ),
+            },
+            sys.stdout,
+        )
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
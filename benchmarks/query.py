@@ -0,0 +1,60 @@
+import json
+import sys
+import timeit
+from typing import Callable, Dict, List
+from urllib.parse import parse_qs
+
+from apidaora.asgi.query import make_query_parser
+from apidaora.cache import LRUCache
+
+
+PARSES = 10000
+QUERY_STRINGS = {
+    'small': b'name=Me&page=2',
+    'tracking': (
+        b'name=Me&page=2&utm_source=newsletter&utm_medium=email'
+        b'&utm_campaign=spring%20sale&fbclid=IwAR2x&gclid=Cj0KCQ'
+        b'&ref=home&lang=pt-BR&tags=a,b,c'
+    ),
+    'flooding': b'&'.join(b'arg%d=%d' % (i, i) for i in range(99)),
+}
+NAMES = ('name', 'page', 'tags')
+
+
+def legacy_parse(query_string: bytes) -> Dict[str, List[str]]:
+    return parse_qs(query_string.decode())
+
+
+def run(parse: Callable[[bytes], Dict[str, List[str]]], qs: bytes) -> float:
+    def parse_all() -> None:
+        for _ in range(PARSES):
+            parse(qs)
+
+    return min(timeit.repeat(parse_all, number=1, repeat=5)) / PARSES
+
+
+def main() -> None:
+    for qs_name, qs in QUERY_STRINGS.items():
+        parsers = {
+            'parse_qs': legacy_parse,
+            'whitelist': make_query_parser(NAMES),
+            'whitelist-cached': make_query_parser(
+                NAMES, cache=LRUCache(maxsize=1024)
+            ),
+        }
+
+        for name, parse in parsers.items():
+            json.dump(
+                {
+                    'benchmark': 'query',
+                    'parser': name,
+                    'query_string': qs_name,
+                    'seconds_per_parse': run(parse, qs),
+                },
+                sys.stdout,
+            )
+            sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
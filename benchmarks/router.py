@@ -0,0 +1,158 @@
+import json
+import re
+import sys
+import timeit
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Pattern
+
+from apidaora.asgi.router import ResolvedRoute, Route, make_tree_router
+from apidaora.cache import LRUCache
+from apidaora.exceptions import MethodNotFoundError, PathNotFoundError
+from apidaora.method import MethodType
+
+
+ROUTES_SIZES = (10, 1000, 10000)
+LOOKUPS = 10000
+
+
+class LegacyRoutesTree(DefaultDict[str, Any]):
+    regex: Optional[Dict[str, Any]] = None
+
+    def __init__(self) -> None:
+        super().__init__(LegacyRoutesTree)
+
+
+def make_legacy_tree_router(
+    routes: List[Route],
+) -> Callable[[str, str], ResolvedRoute]:
+    path_re = re.compile(r'\{(?P<name>[^/:]+)(:(?P<pattern>[^/:]+))?\}')
+    routes_tree = LegacyRoutesTree()
+
+    for route in routes:
+        routes_tree_tmp = routes_tree
+
+        for part in route.path_pattern.strip(' /').split('/'):
+            match = path_re.match(part)
+
+            if match:
+                pattern = match.group('pattern')
+                routes_tree_tmp.regex = {
+                    'name': match.group('name'),
+                    'compiled_re': re.compile(pattern) if pattern else None,
+                }
+                routes_tree_tmp = routes_tree_tmp[match.group('name')]
+                continue
+
+            routes_tree_tmp = routes_tree_tmp[part]
+
+        routes_tree_tmp[route.method.value] = route
+
+    def route_(path: str, method: str) -> ResolvedRoute:
+        path_args = {}
+        routes_tree_ = routes_tree
+
+        for part in path.strip(' /').split('/'):
+            if part in routes_tree_:
+                routes_tree_ = routes_tree_[part]
+                continue
+
+            if routes_tree_.regex:
+                compiled_re: Optional[Pattern[Any]]
+                compiled_re = routes_tree_.regex['compiled_re']
+
+                if compiled_re and not compiled_re.match(part):
+                    raise PathNotFoundError(path)
+
+                path_args[routes_tree_.regex['name']] = part
+                routes_tree_ = routes_tree_[routes_tree_.regex['name']]
+                continue
+
+            raise PathNotFoundError(path)
+
+        if method not in routes_tree_:
+            raise MethodNotFoundError(method, path)
+
+        return ResolvedRoute(routes_tree_[method], path_args, path)
+
+    return route_
+
+
+class BenchmarkController:
+    middlewares = None
+
+    def __call__(self, request: Any) -> Any:
+        ...
+
+
+def make_routes(size: int) -> List[Route]:
+    controller: Any = BenchmarkController()
+    routes = []
+
+    for i in range(size):
+        if i % 2:
+            path_pattern = f'/api/v1/resource{i}/{{id}}/items/{{item_id}}'
+        else:
+            path_pattern = f'/api/v1/resource{i}/list'
+
+        routes.append(Route(path_pattern, MethodType.GET, controller))
+
+    return routes
+
+
+def make_paths(size: int) -> List[str]:
+    return [
+        f'/api/v1/resource{i}/{i * 7}/items/{i * 13}'
+        if i % 2
+        else f'/api/v1/resource{i}/list'
+        for i in range(size)
+    ]
+
+
+def make_parameterized_paths(size: int) -> List[str]:
+    return [
+        f'/api/v1/resource{i}/{i * 7}/items/{i * 13}'
+        for i in range(1, size, 2)
+    ]
+
+
+def run(
+    router: Callable[[str, str], ResolvedRoute], paths: List[str]
+) -> float:
+    lookups = [paths[i % len(paths)] for i in range(LOOKUPS)]
+
+    def lookup() -> None:
+        for path in lookups:
+            router(path, 'GET')
+
+    return min(timeit.repeat(lookup, number=1, repeat=5)) / LOOKUPS
+
+
+def main() -> None:
+    for size in ROUTES_SIZES:
+        routes = make_routes(size)
+        paths_sets = {
+            'mixed': make_paths(size),
+            'parameterized': make_parameterized_paths(size),
+        }
+        routers = {
+            'legacy-tree': make_legacy_tree_router(routes),
+            'tree': make_tree_router(routes),
+            'tree-cached': make_tree_router(routes, cache=LRUCache()),
+        }
+
+        for paths_name, paths in paths_sets.items():
+            for name, router in routers.items():
+                json.dump(
+                    {
+                        'benchmark': 'router',
+                        'router': name,
+                        'routes': size,
+                        'paths': paths_name,
+                        'seconds_per_lookup': run(router, paths),
+                    },
+                    sys.stdout,
+                )
+                sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
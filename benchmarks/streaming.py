@@ -0,0 +1,81 @@
+import asyncio
+import json
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, List
+
+from jsondaora import dataclass_asjson
+
+from apidaora.content import ContentType
+from apidaora.route.output_serializer import make_stream_chunks
+
+
+ITEMS = 1_000_000
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+    price: float
+
+
+def make_items() -> Iterator[Item]:
+    for i in range(ITEMS):
+        yield Item(id=i, name=f'item-{i}', price=i / 100)
+
+
+def run_buffered() -> int:
+    items: List[Item] = list(make_items())
+    return len(dataclass_asjson(items))
+
+
+def run_stream(content_type: ContentType) -> Callable[[], int]:
+    async def consume() -> int:
+        size = 0
+
+        async for chunk in make_stream_chunks(make_items(), content_type):
+            size += len(chunk)
+
+        return size
+
+    return lambda: asyncio.run(consume())
+
+
+def measure(run: Callable[[], int]) -> Any:
+    tracemalloc.start()
+    size = run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'bytes_sent': size,
+        'peak_memory_bytes': peak,
+        'seconds': min(timeit.repeat(run, number=1, repeat=3)),
+    }
+
+
+def main() -> None:
+    runs = {
+        'buffered-json': run_buffered,
+        'stream-json-array': run_stream(ContentType.APPLICATION_JSON),
+        'stream-ndjson': run_stream(ContentType.APPLICATION_NDJSON),
+    }
+
+    for name, run in runs.items():
+        json.dump(
+            {
+                'benchmark': 'streaming',
+                'serializer': name,
+                'items': ITEMS,
+                **measure(run),
+            },
+            sys.stdout,
+        )
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+from typing import TypedDict
+
+from jsondaora import jsondaora
+
+from apidaora import BodyStream, appdaora, route
+
+
+@jsondaora
+class You(TypedDict):
+    name: str
+
+
+@route.post('/hello', max_body_size=32)
+def hello_controller(body: You) -> str:
+    return f'Hello {body["name"]}!'
+
+
+@route.post('/upload')
+async def upload_controller(body: BodyStream) -> int:
+    size = 0
+
+    async for chunk in body:
+        size += len(chunk)
+
+    return size
+
+
+app = appdaora([hello_controller, upload_controller], max_body_size=1024)
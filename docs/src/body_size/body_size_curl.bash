@@ -0,0 +1 @@
+curl -i -X POST localhost:8000/hello -d '{"name":"Me, Myself and I, and You"}'
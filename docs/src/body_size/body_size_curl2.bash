@@ -0,0 +1,2 @@
+curl -i -X POST localhost:8000/hello -H 'transfer-encoding: chunked' \
+    -d '{"name":"Me, Myself and I, and You"}'
@@ -0,0 +1,2 @@
+head -c 2000 /dev/zero | curl -i -X POST localhost:8000/upload \
+    -H 'transfer-encoding: chunked' --data-binary @-
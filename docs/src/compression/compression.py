@@ -0,0 +1,14 @@
+from apidaora import Compression, ContentType, appdaora, route
+
+
+@route.get('/hello')
+def hello_controller(name: str) -> str:
+    return f'Hello {name}! ' * 100
+
+
+app = appdaora(
+    hello_controller,
+    compression=Compression(
+        min_size=500, levels={ContentType.APPLICATION_JSON: 9}
+    ),
+)
@@ -0,0 +1 @@
+curl -i --compressed 'localhost:8000/hello?name=Me'
@@ -0,0 +1,13 @@
+from apidaora import Header, appdaora, route
+
+
+class ReqID(Header, type=str, http_name='http_req_id'):
+    ...
+
+
+@route.get('/hello/{name}', direct_call=True)
+def hello_controller(name: str, last_name: str, req_id: ReqID) -> str:
+    return f'Hello {name} {last_name}! ({req_id.value})'
+
+
+app = appdaora(hello_controller)
@@ -0,0 +1 @@
+curl -i 'localhost:8000/hello/Me?last_name=Myself' -H 'http_req_id: 1a2b3c4d'
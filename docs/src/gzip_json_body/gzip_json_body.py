@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from apidaora import appdaora, route
+
+
+@dataclass
+class You:
+    name: str
+
+
+@route.post('/hello')
+def hello_controller(body: You) -> str:
+    return f'Hello {body.name}!'
+
+
+app = appdaora(hello_controller, max_decompressed_body_size=1024 * 1024)
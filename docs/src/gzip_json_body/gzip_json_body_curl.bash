@@ -0,0 +1,3 @@
+echo -n '{"name": "Me"}' | gzip > you.json.gz
+
+curl -X POST -i localhost:8000/hello -H 'content-encoding: gzip' --data-binary @you.json.gz
@@ -0,0 +1 @@
+curl -X POST -i localhost:8000/hello -H 'content-encoding: br' --data-binary @you.json.gz
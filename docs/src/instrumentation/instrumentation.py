@@ -0,0 +1,19 @@
+from apidaora import Instrumentation, appdaora, route
+
+
+@route.get('/hello/{name}')
+def hello_controller(name: str) -> str:
+    return f'Hello {name}!'
+
+
+def log_slow_stages(route: str, stage: str, seconds: float) -> None:
+    if seconds > 0.1:
+        print(f'slow {stage} on {route}: {seconds:.3f}s')
+
+
+instrumentation = Instrumentation(
+    callback=log_slow_stages,
+    buckets=(0.001, 0.01, 0.1),
+    metrics_path='/metrics',
+)
+app = appdaora(hello_controller, instrumentation=instrumentation)
@@ -0,0 +1 @@
+curl -i localhost:8000/hello-post-execution -X OPTIONS -H 'origin: https://my-server.domain' -H 'access-control-request-method: GET'
@@ -0,0 +1,50 @@
+import asyncio
+from http import HTTPStatus
+from typing import Any, Optional
+
+from jsondaora import jsondaora
+
+from apidaora import (
+    Header,
+    Middlewares,
+    Request,
+    Response,
+    appdaora,
+    json,
+    route,
+)
+
+
+TOKENS = {'my-token': 'Me'}
+
+
+async def auth_middleware(request: Request) -> Optional[Response]:
+    await asyncio.sleep(0)  # an async token store lookup
+    token = request.headers.get('token') if request.headers else None
+
+    if token is None or token.value not in TOKENS:
+        return json({'error': 'invalid-token'}, HTTPStatus.UNAUTHORIZED)
+
+    request.ctx['name'] = TOKENS[token.value]
+    return None
+
+
+class TokenHeader(Header, type=str, http_name='x-token'):
+    ...
+
+
+@jsondaora
+class Greeting:
+    greeting: str
+
+
+@route.post(
+    '/hello', middlewares=Middlewares(pre_execution=auth_middleware),
+)
+async def hello_controller(
+    body: Greeting, token: TokenHeader, **kwargs: Any
+) -> str:
+    return f'{body.greeting} {kwargs["name"]}!'
+
+
+app = appdaora(hello_controller)
@@ -0,0 +1 @@
+curl -X POST -i localhost:8000/hello -H 'x-token: my-token' -d '{"greeting": "Hello"}'
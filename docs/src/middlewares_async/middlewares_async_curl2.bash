@@ -0,0 +1 @@
+curl -X POST -i localhost:8000/hello -H 'x-token: other-token' -d '{"greeting": "Hello"}'
@@ -0,0 +1,9 @@
+from apidaora import appdaora, route
+
+
+@route.get('/hello/{name}')
+def hello_controller(name: str, last_name: str) -> str:
+    return f'Hello {name} {last_name}!'
+
+
+app = appdaora(hello_controller, pool_size=128)
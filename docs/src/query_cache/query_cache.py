@@ -0,0 +1,11 @@
+from typing import List
+
+from apidaora import LRUCache, appdaora, route
+
+
+@route.get('/hello', query_cache=LRUCache(maxsize=256))
+def hello_controller(name: str, tags: List[str]) -> str:
+    return f'Hello {name}! ({", ".join(tags)})'
+
+
+app = appdaora(hello_controller)
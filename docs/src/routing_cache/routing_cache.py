@@ -0,0 +1,13 @@
+from apidaora import LRUCache, appdaora, route
+
+
+@route.get('/hello/{name}')
+def hello_controller(name: str) -> str:
+    return f'Hello {name}!'
+
+
+app = appdaora(
+    hello_controller,
+    routes_cache=LRUCache(maxsize=1024),
+    not_found_cache=LRUCache(maxsize=1024),
+)
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, List
+
+from apidaora import Response, appdaora, json_stream, ndjson, route
+
+
+@dataclass
+class You:
+    name: str
+    greeting: str
+
+
+def make_yous(name: str) -> List[You]:
+    return [You(name, greeting) for greeting in ('Hello', 'Hi', 'Hey')]
+
+
+async def make_yous_async(name: str) -> AsyncIterator[You]:
+    for you in make_yous(name):
+        yield you
+
+
+def make_numbered_yous(name: str, count: int) -> Iterator[You]:
+    for number in range(count):
+        yield You(f'{name} {number}', 'Hello')
+
+
+@route.get('/hello-array')
+def hello_array_controller(name: str) -> Response:
+    return json_stream(make_yous(name))
+
+
+@route.get('/hello-ndjson')
+async def hello_ndjson_controller(name: str) -> Response:
+    return ndjson(make_yous_async(name))
+
+
+@route.get('/hello-generator')
+def hello_generator_controller(name: str, count: int) -> Response:
+    return json_stream(make_numbered_yous(name, count))
+
+
+app = appdaora(
+    [
+        hello_array_controller,
+        hello_ndjson_controller,
+        hello_generator_controller,
+    ]
+)
@@ -0,0 +1 @@
+curl -i 'localhost:8000/hello-array?name=Me'
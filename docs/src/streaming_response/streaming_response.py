@@ -0,0 +1,28 @@
+from typing import AsyncIterator, Iterator
+
+from apidaora import ContentType, Response, appdaora, route, stream
+
+
+def make_lines(name: str) -> Iterator[str]:
+    for greeting in ('Hello', 'Hi', 'Hey'):
+        yield f'{greeting} {name}!\n'
+
+
+async def make_report(name: str) -> AsyncIterator[str]:
+    yield 'name,greeting\n'
+
+    for greeting in ('Hello', 'Hi', 'Hey'):
+        yield f'{name},{greeting}\n'
+
+
+@route.get('/hello-lines')
+def hello_lines_controller(name: str) -> Response:
+    return stream(make_lines(name))
+
+
+@route.get('/hello-report')
+async def hello_report_controller(name: str) -> Response:
+    return stream(make_report(name), content_type=ContentType.TEXT_PLAIN)
+
+
+app = appdaora([hello_lines_controller, hello_report_controller])